@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import bisect
+import mmap
+import re
+import struct
+from collections.abc import Iterable
+from typing import BinaryIO, cast
+
+from PySide6.QtCore import QResource
+
+from flipflops.frame import Frame, Geometry
+
+# NOTE: Magic, version, width, height, frames per second and frame count, all
+#       little-endian. Frames follow back to back, each one exactly as
+#       Frame.pack() puts it on the wire.
+_HEADER = struct.Struct("<4sBxHHHI")
+_MAGIC = b"FLIP"
+_VERSION = 1
+
+# NOTE: Streams share the header but store each frame as a record of a varint
+#       holding the payload length shifted left once with the low bit set for
+#       deltas, followed by a run-length coded payload. Keyframes code the
+#       frame itself and deltas code its XOR with the frame before. A footer
+#       after the last record lists where every keyframe starts.
+_STREAM_VERSION = 2
+_INDEX_ENTRY = struct.Struct("<IQ")
+_FOOTER = struct.Struct("<I4s")
+_INDEX_MAGIC = b"FIDX"
+
+_RUNS = re.compile(rb"(\x00*)([^\x00]*)")
+
+
+class Animation:
+    def __init__(self, data: memoryview) -> None:
+        if len(data) < _HEADER.size:
+            raise ValueError("Animation is missing its header.")
+
+        magic, version, width, height, fps, count = _HEADER.unpack_from(data)
+
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Animation has an unsupported header.")
+
+        self._data: memoryview = data
+        self._geometry: Geometry = Geometry(width, height)
+        self._fps: int = fps
+        self._count: int = count
+        self._stride: int = (self._geometry.dots() + 7) // 8
+
+        if len(data) < _HEADER.size + count * self._stride:
+            raise ValueError("Animation is shorter than its header says.")
+
+    @staticmethod
+    def from_resource(path: str) -> Animation:
+        resource = QResource(path)
+
+        if not resource.isValid():
+            raise FileNotFoundError(f"Failed to read {path}.")
+
+        assert resource.compressionAlgorithm() == QResource.Compression.NoCompression
+        return Animation(cast(memoryview, resource.data()))
+
+    @staticmethod
+    def from_file(path: str) -> Animation:
+        with open(path, "rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return Animation(memoryview(data))
+
+    @staticmethod
+    def encode(geometry: Geometry, fps: int, frames: Iterable[Frame]) -> bytes:
+        packed = []
+
+        for frame in frames:
+            assert frame.geometry() == geometry
+            packed.append(frame.pack())
+
+        header = _HEADER.pack(
+            _MAGIC, _VERSION, geometry.width, geometry.height, fps, len(packed)
+        )
+
+        return header + b"".join(packed)
+
+    def geometry(self) -> Geometry:
+        return self._geometry
+
+    def fps(self) -> int:
+        return self._fps
+
+    def packed(self, index: int) -> memoryview:
+        start = _HEADER.size + index * self._stride
+        return self._data[start : start + self._stride]
+
+    def frame(self, index: int) -> Frame:
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+
+        return Frame(self._geometry, int.from_bytes(self.packed(index), "little"))
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class AnimationWriter:
+    def __init__(
+        self, path: str, geometry: Geometry, fps: int, keyframe_interval: int = 300
+    ) -> None:
+        self._file: BinaryIO = open(path, "wb")
+        self._geometry: Geometry = geometry
+        self._fps: int = fps
+        self._keyframe_interval: int = keyframe_interval
+
+        self._count: int = 0
+        self._previous: Frame | None = None
+        self._index: list[tuple[int, int]] = []
+
+        self._file.write(self._header())
+
+    def write(self, frame: Frame) -> None:
+        assert frame.geometry() == self._geometry
+
+        if self._previous is None or self._count % self._keyframe_interval == 0:
+            delta = False
+            payload = _encode_runs(frame.pack())
+            self._index.append((self._count, self._file.tell()))
+        else:
+            delta = True
+            payload = _encode_runs((self._previous ^ frame).pack())
+
+        record = bytearray()
+        _write_varint(record, len(payload) << 1 | delta)
+        self._file.write(record + payload)
+
+        self._previous = frame
+        self._count += 1
+
+    def close(self) -> None:
+        for entry in self._index:
+            self._file.write(_INDEX_ENTRY.pack(*entry))
+
+        self._file.write(_FOOTER.pack(len(self._index), _INDEX_MAGIC))
+        self._file.seek(0)
+        self._file.write(self._header())
+        self._file.close()
+
+    def _header(self) -> bytes:
+        return _HEADER.pack(
+            _MAGIC,
+            _STREAM_VERSION,
+            self._geometry.width,
+            self._geometry.height,
+            self._fps,
+            self._count,
+        )
+
+
+class AnimationReader:
+    def __init__(self, path: str) -> None:
+        self._file: BinaryIO = open(path, "rb", buffering=64 * 1024)
+
+        magic, version, width, height, fps, count = _HEADER.unpack(
+            self._file.read(_HEADER.size)
+        )
+
+        if magic != _MAGIC or version not in [_VERSION, _STREAM_VERSION]:
+            self._file.close()
+            raise ValueError("Animation has an unsupported header.")
+
+        self._version: int = version
+        self._geometry: Geometry = Geometry(width, height)
+        self._fps: int = fps
+        self._count: int = count
+        self._stride: int = (self._geometry.dots() + 7) // 8
+
+        self._keyframes: list[int] = []
+        self._offsets: list[int] = []
+        self._next: int = 0
+        self._current: Frame = Frame(self._geometry)
+
+        if version == _STREAM_VERSION:
+            self._read_index()
+            self._file.seek(_HEADER.size)
+
+    def geometry(self) -> Geometry:
+        return self._geometry
+
+    def fps(self) -> int:
+        return self._fps
+
+    def frame(self, index: int) -> Frame:
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+
+        if self._version == _VERSION:
+            self._file.seek(_HEADER.size + index * self._stride)
+            data = self._file.read(self._stride)
+            return Frame(self._geometry, int.from_bytes(data, "little"))
+
+        if index == self._next - 1:
+            return self._current
+
+        keyframe = bisect.bisect_right(self._keyframes, index) - 1
+
+        if index < self._next or self._keyframes[keyframe] > self._next:
+            self._file.seek(self._offsets[keyframe])
+            self._next = self._keyframes[keyframe]
+
+        while self._next <= index:
+            record = 0
+            shift = 0
+
+            while True:
+                byte = self._file.read(1)[0]
+                record |= (byte & 0x7F) << shift
+                shift += 7
+
+                if byte < 0x80:
+                    break
+
+            data = _decode_runs(self._file.read(record >> 1), self._stride)
+            bits = int.from_bytes(data, "little")
+
+            if record & 1 == 1:
+                bits ^= self._current.bits()
+
+            self._current = Frame(self._geometry, bits)
+            self._next += 1
+
+        return self._current
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _read_index(self) -> None:
+        self._file.seek(-_FOOTER.size, 2)
+        count, magic = _FOOTER.unpack(self._file.read(_FOOTER.size))
+
+        if magic != _INDEX_MAGIC:
+            self._file.close()
+            raise ValueError("Animation is missing its keyframe index.")
+
+        self._file.seek(-_FOOTER.size - count * _INDEX_ENTRY.size, 2)
+
+        for frame, offset in _INDEX_ENTRY.iter_unpack(
+            self._file.read(count * _INDEX_ENTRY.size)
+        ):
+            self._keyframes.append(frame)
+            self._offsets.append(offset)
+
+
+# NOTE: Runs alternate between a count of zero bytes and a count of literal
+#       bytes followed by those bytes, with both counts as LEB128 varints.
+def _encode_runs(data: bytes) -> bytes:
+    output = bytearray()
+
+    for match in _RUNS.finditer(data):
+        zeros, literal = match.groups()
+
+        if len(zeros) == 0 and len(literal) == 0:
+            continue
+
+        _write_varint(output, len(zeros))
+        _write_varint(output, len(literal))
+        output += literal
+
+    return bytes(output)
+
+
+def _decode_runs(data: bytes, length: int) -> bytes:
+    output = bytearray()
+    position = 0
+
+    while len(output) < length:
+        zeros, position = _read_varint(data, position)
+        literal, position = _read_varint(data, position)
+        output += bytes(zeros)
+        output += data[position : position + literal]
+        position += literal
+
+    return bytes(output)
+
+
+def _write_varint(output: bytearray, value: int) -> None:
+    while value >= 0x80:
+        output.append(value & 0x7F | 0x80)
+        value >>= 7
+
+    output.append(value)
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+
+        if byte < 0x80:
+            return value, position
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import os
+
+from PySide6.QtCore import Qt, QTimer, Slot
+from PySide6.QtWidgets import (
+    QComboBox,
+    QFileDialog,
+    QHBoxLayout,
+    QLabel,
+    QMessageBox,
+    QPushButton,
+    QSlider,
+    QVBoxLayout,
+    QWidget,
+)
+
+from flipflops.animation import AnimationReader
+from flipflops.display import Display
+from flipflops.playback_clock import PlaybackClock
+
+
+class AnimationPlayer(QWidget):
+    def __init__(self, index: int, display: Display) -> None:
+        super().__init__()
+
+        self._index: int = index
+
+        self._display: Display = display
+        self._display.on_ready.connect(self._handle_ready)
+        self._display.on_writable.connect(self._handle_tick)
+        self._display.on_close.connect(self._handle_close)
+
+        self._reader: AnimationReader | None = None
+        self._clock: PlaybackClock = PlaybackClock(30)
+        self._ready: bool = False
+        self._playing: bool = False
+
+        self._timer: QTimer = QTimer(
+            interval=1000 // 60, timerType=Qt.TimerType.PreciseTimer
+        )
+        self._timer.timeout.connect(self._handle_tick)
+
+        vbox = QVBoxLayout()
+        vbox.setSpacing(5)
+        vbox.setContentsMargins(0, 0, 0, 0)
+        vbox.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        vbox.addStretch(1)
+
+        self._name: QLabel = QLabel("No animation open")
+        vbox.addWidget(self._name)
+
+        self._details: QLabel = QLabel()
+        vbox.addWidget(self._details)
+
+        self._frame_on: QLabel = QLabel("Frame: 0 of 0")
+        vbox.addWidget(self._frame_on)
+
+        self._frames_dropped: QLabel = QLabel("Frames Dropped: 0")
+        vbox.addWidget(self._frames_dropped)
+
+        self._seek_slider: QSlider = QSlider(Qt.Orientation.Horizontal)
+        self._seek_slider.setFixedWidth(300)
+        self._seek_slider.setEnabled(False)
+        self._seek_slider.sliderMoved.connect(self._handle_seek)
+        vbox.addWidget(self._seek_slider)
+
+        hbox = QHBoxLayout()
+        hbox.setSpacing(5)
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        open_file = QPushButton("Open")
+        open_file.clicked.connect(self._handle_open)
+        hbox.addWidget(open_file)
+
+        self._policy_select: QComboBox = QComboBox()
+
+        for policy in PlaybackClock.Policy:
+            self._policy_select.addItem(str(policy), policy)
+
+        self._policy_select.currentIndexChanged.connect(self._handle_policy_select)
+        hbox.addWidget(self._policy_select)
+
+        self._play_pause: QPushButton = QPushButton("Pause")
+        self._play_pause.setFixedWidth(self._play_pause.sizeHint().width())
+        self._play_pause.setText("Play")
+        self._play_pause.setEnabled(False)
+        self._play_pause.clicked.connect(self._handle_play_pause)
+        hbox.addWidget(self._play_pause)
+
+        vbox.addLayout(hbox)
+
+        vbox.addStretch(1)
+
+        self.setLayout(vbox)
+
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+
+    @Slot()
+    def handle_switch(self, index: int) -> None:
+        if index != self._index:
+            self._pause()
+
+    @Slot()
+    def _handle_ready(self) -> None:
+        self._ready = True
+        self._play_pause.setEnabled(self._reader is not None)
+
+    @Slot()
+    def _handle_close(self) -> None:
+        self._ready = False
+        self._pause()
+        self._play_pause.setEnabled(False)
+
+    @Slot()
+    def _handle_open(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Open Animation", filter="Animations (*.flip)"
+        )
+
+        if len(path) == 0:
+            return
+
+        try:
+            reader = AnimationReader(path)
+        except (OSError, ValueError) as error:
+            QMessageBox.critical(self, "Animation Player", f"{error}")
+            return
+
+        if self._reader is not None:
+            self._reader.close()
+
+        self._pause()
+        self._reader = reader
+        self._clock = PlaybackClock(reader.fps(), self._policy_select.currentData())
+
+        self._name.setText(os.path.basename(path))
+        self._details.setText(f"{reader.geometry()} at {reader.fps()} fps")
+        self._frame_on.setText(f"Frame: 0 of {len(reader)}")
+        self._frames_dropped.setText("Frames Dropped: 0")
+        self._seek_slider.setRange(0, max(0, len(reader) - 1))
+        self._seek_slider.setValue(0)
+        self._seek_slider.setEnabled(True)
+        self._play_pause.setEnabled(self._ready)
+
+    @Slot()
+    def _handle_play_pause(self) -> None:
+        if self._playing:
+            self._pause()
+        else:
+            self._playing = True
+            self._clock.resume()
+            self._timer.start()
+            self._play_pause.setText("Pause")
+
+    @Slot(int)
+    def _handle_seek(self, value: int) -> None:
+        self._clock.seek(value)
+
+    @Slot(int)
+    def _handle_policy_select(self, index: int) -> None:
+        self._clock.set_policy(self._policy_select.itemData(index))
+
+    @Slot()
+    def _handle_tick(self) -> None:
+        if not self._playing or not self._display.can_write():
+            return
+
+        assert self._reader is not None
+
+        index = self._clock.next()
+
+        if index is None:
+            return
+
+        if index >= len(self._reader):
+            self._pause()
+            self._clock.seek(0)
+            return
+
+        frame = self._reader.frame(index)
+        self._display.submit(frame.fit(self._display.geometry()))
+
+        self._frame_on.setText(f"Frame: {index + 1} of {len(self._reader)}")
+        self._frames_dropped.setText(f"Frames Dropped: {self._clock.dropped()}")
+
+        if not self._seek_slider.isSliderDown():
+            self._seek_slider.setSliderPosition(index)
+
+    def _pause(self) -> None:
+        self._playing = False
+        self._clock.pause()
+        self._timer.stop()
+        self._play_pause.setText("Play")
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import statistics
+import time
+from collections import deque
+from typing import NamedTuple
+
+
+class SyncStatistics(NamedTuple):
+    latency: float
+    drift: float
+    jitter: float
+    samples: int
+
+    def __str__(self) -> str:
+        if self.samples == 0:
+            return "Latency: -- ms, Drift: -- ms"
+
+        return (
+            f"Latency: {self.latency:.0f} ms,"
+            f" Drift: {self.drift:+.0f} \N{PLUS-MINUS SIGN} {self.jitter:.0f} ms"
+        )
+
+
+# NOTE: Pairs each frame with the done that finishes it, which only holds while
+#       frames are sent one at a time.
+class AvSync:
+    def __init__(self, window: int = 60) -> None:
+        self._pending: deque[tuple[int, int]] = deque()
+        self._latencies: deque[int] = deque(maxlen=window)
+        self._drifts: deque[int] = deque(maxlen=window)
+
+    def reset(self) -> None:
+        self._pending.clear()
+        self._drifts.clear()
+
+    def latency(self) -> int:
+        if len(self._latencies) == 0:
+            return 0
+
+        return round(statistics.median(self._latencies)) // 1000
+
+    def sent(self, time_us: int) -> None:
+        self._pending.append((time.perf_counter_ns(), time_us))
+
+    def done(self, position_us: int) -> None:
+        if len(self._pending) == 0:
+            return
+
+        sent, time_us = self._pending.popleft()
+        self._latencies.append(time.perf_counter_ns() - sent)
+        self._drifts.append(time_us - position_us)
+
+    def statistics(self) -> SyncStatistics:
+        if len(self._drifts) == 0:
+            return SyncStatistics(0, 0, 0, 0)
+
+        return SyncStatistics(
+            latency=self.latency() / 1000,
+            drift=statistics.fmean(self._drifts) / 1000,
+            jitter=statistics.pstdev(self._drifts) / 1000,
+            samples=len(self._drifts),
+        )
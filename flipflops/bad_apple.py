@@ -1,26 +1,21 @@
 from __future__ import annotations
 
-import json
-import math
-import time
-from typing import cast
-
-from PySide6.QtCore import QFile, Qt, Slot
-from PySide6.QtWidgets import QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
-
+from PySide6.QtCore import Qt, QTimer, Slot
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QSlider,
+    QVBoxLayout,
+    QWidget,
+)
+
+from flipflops.animation import Animation
 from flipflops.display import Display
+from flipflops.playback_clock import PlaybackClock
 
-
-def _load_frames() -> list[str]:
-    file = QFile(":/resources/bad_apple.json")
-
-    if not file.open(QFile.OpenModeFlag.ReadOnly):
-        raise FileNotFoundError("Failed to read :/resources/bad_apple.json.")
-
-    return cast(list[str], json.loads(bytes(file.readAll().data())))
-
-
-_FRAMES = _load_frames()
+_ANIMATION = Animation.from_resource(":/resources/bad_apple.flip")
 
 
 class BadApple(QWidget):
@@ -31,13 +26,19 @@ class BadApple(QWidget):
 
         self._display: Display = display
         self._display.on_ready.connect(self._handle_ready)
-        self._display.on_done.connect(self._handle_ready)
+        self._display.on_done.connect(self._handle_done)
+        self._display.on_writable.connect(self._handle_tick)
         self._display.on_close.connect(self._handle_close)
 
-        self._start_time: float = 0
+        self._clock: PlaybackClock = PlaybackClock(_ANIMATION.fps())
         self._frames_total: int = 0
+        self._frames_unchanged: int = 0
         self._playing: bool = False
-        self._ready: bool = False
+
+        self._timer: QTimer = QTimer(
+            interval=1000 // 60, timerType=Qt.TimerType.PreciseTimer
+        )
+        self._timer.timeout.connect(self._handle_tick)
 
         vbox = QVBoxLayout()
         vbox.setSpacing(5)
@@ -48,7 +49,7 @@ class BadApple(QWidget):
 
         self._frame_on: QLabel = QLabel("Frame: 0000 of 0000")
         self._frame_on.setFixedWidth(self._frame_on.sizeHint().width())
-        self._frame_on.setText(f"Frame: 0 of {len(_FRAMES)}")
+        self._frame_on.setText(f"Frame: 0 of {len(_ANIMATION)}")
         vbox.addWidget(self._frame_on)
 
         self._frames_played: QLabel = QLabel("Frames Played: 0000")
@@ -56,15 +57,57 @@ class BadApple(QWidget):
         self._frames_played.setText(f"Frames Played: {self._frames_total}")
         vbox.addWidget(self._frames_played)
 
+        self._frames_on_time: QLabel = QLabel("Frames On Time: 0000")
+        self._frames_on_time.setFixedWidth(self._frames_on_time.sizeHint().width())
+        vbox.addWidget(self._frames_on_time)
+
+        self._frames_late: QLabel = QLabel("Frames Late: 0000")
+        self._frames_late.setFixedWidth(self._frames_late.sizeHint().width())
+        vbox.addWidget(self._frames_late)
+
+        self._frames_dropped: QLabel = QLabel("Frames Dropped: 0000")
+        self._frames_dropped.setFixedWidth(self._frames_dropped.sizeHint().width())
+        vbox.addWidget(self._frames_dropped)
+
+        self._frames_skipped: QLabel = QLabel("Frames Skipped: 0000")
+        self._frames_skipped.setFixedWidth(self._frames_skipped.sizeHint().width())
+        vbox.addWidget(self._frames_skipped)
+
+        self._update_counts()
+
+        self._seek_slider: QSlider = QSlider(Qt.Orientation.Horizontal)
+        self._seek_slider.setRange(0, len(_ANIMATION) - 1)
+        self._seek_slider.setFixedWidth(300)
+        self._seek_slider.setEnabled(False)
+        self._seek_slider.sliderMoved.connect(self._handle_seek)
+        vbox.addWidget(self._seek_slider)
+
         hbox = QHBoxLayout()
-        hbox.setSpacing(0)
+        hbox.setSpacing(5)
         hbox.setContentsMargins(0, 0, 0, 0)
         hbox.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self._policy_select: QComboBox = QComboBox()
+
+        for policy in PlaybackClock.Policy:
+            self._policy_select.addItem(str(policy), policy)
+
+        self._policy_select.currentIndexChanged.connect(self._handle_policy_select)
+        hbox.addWidget(self._policy_select)
+
         self._start_stop: QPushButton = QPushButton("Start")
         self._start_stop.setEnabled(False)
         self._start_stop.setFixedWidth(self._start_stop.sizeHint().width())
         self._start_stop.clicked.connect(self._handle_start_stop)
         hbox.addWidget(self._start_stop)
+
+        self._pause_resume: QPushButton = QPushButton("Resume")
+        self._pause_resume.setFixedWidth(self._pause_resume.sizeHint().width())
+        self._pause_resume.setText("Pause")
+        self._pause_resume.setEnabled(False)
+        self._pause_resume.clicked.connect(self._handle_pause_resume)
+        hbox.addWidget(self._pause_resume)
+
         vbox.addLayout(hbox)
 
         vbox.addStretch(1)
@@ -75,51 +118,94 @@ class BadApple(QWidget):
 
     @Slot()
     def handle_switch(self, index: int) -> None:
-        if index != self._index:
-            self._playing = False
-            self._frames_total = 0
-            self._start_stop.setText("Start")
+        if index != self._index and self._playing:
+            self._clock.pause()
+            self._pause_resume.setText("Resume")
 
     @Slot()
     def _handle_ready(self) -> None:
         self._start_stop.setEnabled(True)
 
+    @Slot()
+    def _handle_done(self) -> None:
         if not self._playing:
-            self._ready = True
             return
 
-        current_time = time.time()
-        index = math.floor((current_time - self._start_time) * 30)
+        self._frames_total += 1
+        self._frames_played.setText(f"Frames Played: {self._frames_total}")
 
-        if index >= len(_FRAMES):
-            self._playing = False
-            self._frames_total = 0
-            self._start_stop.setText("Start")
+    @Slot()
+    def _handle_tick(self) -> None:
+        if not self._playing or not self._display.can_write():
             return
 
-        self._display.write(b"display: " + _FRAMES[index].encode("ascii"))
+        index = self._clock.next()
 
-        self._frames_total += 1
-        self._frame_on.setText(f"Frame: {index + 1} of {len(_FRAMES)}")
-        self._frames_played.setText(f"Frames Played: {self._frames_total}")
+        if index is None:
+            return
+
+        if index >= len(_ANIMATION):
+            self._stop()
+            return
+
+        if not self._display.submit(
+            _ANIMATION.frame(index).fit(self._display.geometry())
+        ):
+            self._frames_unchanged += 1
+
+        self._frame_on.setText(f"Frame: {index + 1} of {len(_ANIMATION)}")
+        self._update_counts()
+
+        if not self._seek_slider.isSliderDown():
+            self._seek_slider.setSliderPosition(index)
+
+    @Slot(int)
+    def _handle_seek(self, value: int) -> None:
+        self._clock.seek(value)
+
+    @Slot(int)
+    def _handle_policy_select(self, index: int) -> None:
+        self._clock.set_policy(self._policy_select.itemData(index))
 
     @Slot()
     def _handle_close(self) -> None:
-        self._playing = False
+        self._stop()
         self._start_stop.setEnabled(False)
-        self._start_stop.setText("Start")
 
     @Slot()
     def _handle_start_stop(self) -> None:
         if self._playing:
-            self._playing = False
-            self._frames_total = 0
-            self._start_stop.setText("Start")
+            self._stop()
         else:
-            self._start_time = time.time()
+            self._clock.start()
             self._playing = True
+            self._timer.start()
+            self._seek_slider.setEnabled(True)
+            self._pause_resume.setEnabled(True)
             self._start_stop.setText("Stop")
+            self._update_counts()
+
+    @Slot()
+    def _handle_pause_resume(self) -> None:
+        if self._clock.is_paused():
+            self._clock.resume()
+            self._pause_resume.setText("Pause")
+        else:
+            self._clock.pause()
+            self._pause_resume.setText("Resume")
+
+    def _stop(self) -> None:
+        self._playing = False
+        self._frames_total = 0
+        self._frames_unchanged = 0
+        self._timer.stop()
+        self._seek_slider.setEnabled(False)
+        self._pause_resume.setEnabled(False)
+        self._pause_resume.setText("Pause")
+        self._start_stop.setText("Start")
 
-            if self._ready:
-                self._ready = False
-                self._handle_ready()
+    def _update_counts(self) -> None:
+        self._frames_on_time.setText(f"Frames On Time: {self._clock.on_time()}")
+        self._frames_late.setText(f"Frames Late: {self._clock.late()}")
+        self._frames_dropped.setText(f"Frames Dropped: {self._clock.dropped()}")
+        self._frames_skipped.setText(f"Frames Skipped: {self._frames_unchanged}")
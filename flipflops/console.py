@@ -94,8 +94,8 @@ class Console(QDockWidget):
 
     @Slot(bytes)
     def _handle_read(self, value: bytes) -> None:
-        self._write("<-", value.decode("ascii"))
+        self._write("<-", value.decode("ascii", errors="backslashreplace"))
 
     @Slot(bytes)
     def _handle_write(self, value: bytes) -> None:
-        self._write("->", value.decode("ascii"))
+        self._write("->", value.decode("ascii", errors="backslashreplace"))
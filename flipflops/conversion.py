@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from enum import Enum, auto
+
+from PySide6.QtCore import QRect, Qt
+from PySide6.QtGui import QImage
+
+from flipflops.frame import Frame, Geometry
+
+_OVERSAMPLE = 8
+
+_BAYER = [0, 8, 2, 10, 12, 4, 14, 6, 3, 11, 1, 9, 15, 7, 13, 5]
+
+
+class Converter:
+    class Mode(Enum):
+        FIXED = auto()
+        OTSU = auto()
+        BAYER = auto()
+        DIFFUSION = auto()
+
+        def __str__(self) -> str:
+            match self:
+                case Converter.Mode.FIXED:
+                    return "Fixed Threshold"
+                case Converter.Mode.OTSU:
+                    return "Otsu Threshold"
+                case Converter.Mode.BAYER:
+                    return "Ordered Dither"
+                case Converter.Mode.DIFFUSION:
+                    return "Error Diffusion"
+
+    def __init__(
+        self, mode: Mode = Mode.FIXED, threshold: int = 128, hysteresis: int = 0
+    ) -> None:
+        assert 0 <= threshold <= 255
+        assert 0 <= hysteresis <= 255
+
+        self._mode: Converter.Mode = mode
+        self._threshold: int = threshold
+        self._hysteresis: int = hysteresis
+        self._previous: Frame | None = None
+
+    def mode(self) -> Converter.Mode:
+        return self._mode
+
+    def threshold(self) -> int:
+        return self._threshold
+
+    def hysteresis(self) -> int:
+        return self._hysteresis
+
+    def key(self) -> str:
+        return f"{self._mode.name.lower()}-{self._threshold}-{self._hysteresis}"
+
+    def copy(self) -> Converter:
+        return Converter(self._mode, self._threshold, self._hysteresis)
+
+    def reset(self) -> None:
+        self._previous = None
+
+    def convert(self, image: QImage) -> Frame:
+        assert image.format() == QImage.Format.Format_Grayscale8
+
+        geometry = Geometry(image.width(), image.height())
+        data = image.constBits()
+        stride = image.bytesPerLine()
+        levels = b"".join(
+            data[r * stride : r * stride + geometry.width]
+            for r in range(geometry.height)
+        )
+
+        previous = self._previous
+
+        if previous is not None and previous.geometry() != geometry:
+            previous = None
+
+        match self._mode:
+            case Converter.Mode.FIXED:
+                frame = self._threshold_levels(
+                    geometry, levels, self._threshold, previous
+                )
+            case Converter.Mode.OTSU:
+                frame = self._threshold_levels(
+                    geometry, levels, _otsu(levels), previous
+                )
+            case Converter.Mode.BAYER:
+                frame = self._dither_ordered(geometry, levels, previous)
+            case Converter.Mode.DIFFUSION:
+                frame = self._dither_diffusion(geometry, levels, previous)
+
+        self._previous = frame
+        return frame
+
+    def _threshold_levels(
+        self, geometry: Geometry, levels: bytes, threshold: int, previous: Frame | None
+    ) -> Frame:
+        if previous is None or self._hysteresis == 0:
+            return _above(geometry, levels, threshold)
+
+        high = _above(geometry, levels, threshold + self._hysteresis)
+        low = _above(geometry, levels, threshold - self._hysteresis)
+        return high | (low & previous)
+
+    def _dither_ordered(
+        self, geometry: Geometry, levels: bytes, previous: Frame | None
+    ) -> Frame:
+        bits = 0 if previous is None else previous.bits()
+        band = 0 if previous is None else self._hysteresis
+        shift = 128 - self._threshold
+        dots = bytearray(geometry.dots())
+
+        for i, level in enumerate(levels):
+            r, c = divmod(i, geometry.width)
+            threshold = _BAYER[(r & 3) * 4 + (c & 3)] * 16 + 8 - shift
+            threshold += -band if bits >> i & 1 else band
+            dots[i] = level >= threshold
+
+        return Frame.from_buffer(geometry, dots)
+
+    def _dither_diffusion(
+        self, geometry: Geometry, levels: bytes, previous: Frame | None
+    ) -> Frame:
+        bits = 0 if previous is None else previous.bits()
+        band = 0 if previous is None else self._hysteresis
+        w = geometry.width
+        h = geometry.height
+
+        errors = [0.0] * (w + 2) * 2
+        dots = bytearray(geometry.dots())
+
+        for r in range(h):
+            current = (r & 1) * (w + 2)
+            below = (w + 2) - current
+            errors[below : below + w + 2] = [0.0] * (w + 2)
+
+            step = -1 if r & 1 else 1
+            columns = range(w - 1, -1, -1) if r & 1 else range(w)
+
+            for c in columns:
+                i = r * w + c
+                level = levels[i] + errors[current + c + 1]
+                threshold = self._threshold
+                threshold += -band if bits >> i & 1 else band
+
+                white = level >= threshold
+                dots[i] = white
+                error = level - (255 if white else 0)
+
+                errors[current + c + 1 + step] += error * 7 / 16
+                errors[below + c + 1 - step] += error * 3 / 16
+                errors[below + c + 1] += error * 5 / 16
+                errors[below + c + 1 + step] += error * 1 / 16
+
+        return Frame.from_buffer(geometry, dots)
+
+
+def convert(image: QImage, geometry: Geometry, converter: Converter) -> Frame:
+    image = image.copy(crop(image.width(), image.height(), geometry))
+    return converter.convert(downscale(image, geometry))
+
+
+def crop(width: int, height: int, geometry: Geometry) -> QRect:
+    s = min(width / geometry.width, height / geometry.height)
+    cw = round(geometry.width * s)
+    ch = round(geometry.height * s)
+
+    return QRect((width - cw) // 2, (height - ch) // 2, cw, ch)
+
+
+def downscale(image: QImage, geometry: Geometry) -> QImage:
+    w = geometry.width * _OVERSAMPLE
+    h = geometry.height * _OVERSAMPLE
+
+    if image.width() > w and image.height() > h:
+        image = image.scaled(
+            w,
+            h,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.FastTransformation,
+        )
+
+    return image.scaled(
+        geometry.width,
+        geometry.height,
+        Qt.AspectRatioMode.IgnoreAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    ).convertToFormat(QImage.Format.Format_Grayscale8)
+
+
+def _above(geometry: Geometry, levels: bytes, threshold: int) -> Frame:
+    table = bytes(0 if level < threshold else 1 for level in range(256))
+    return Frame.from_buffer(geometry, levels.translate(table))
+
+
+def _otsu(levels: bytes) -> int:
+    histogram = [0] * 256
+
+    for level in levels:
+        histogram[level] += 1
+
+    total = len(levels)
+    total_sum = sum(level * count for level, count in enumerate(histogram))
+
+    best = 0.0
+    threshold = 128
+    weight = 0
+    weighted_sum = 0
+
+    for level, count in enumerate(histogram):
+        weight += count
+        weighted_sum += level * count
+
+        if weight == 0 or weight == total:
+            continue
+
+        mean_low = weighted_sum / weight
+        mean_high = (total_sum - weighted_sum) / (total - weight)
+        variance = weight * (total - weight) * (mean_low - mean_high) ** 2
+
+        if variance > best:
+            best = variance
+            threshold = level + 1
+
+    return threshold
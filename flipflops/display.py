@@ -1,13 +1,39 @@
-# TODO: Support displays of sizes other than 6x6.
 # TODO: Use QEnum once typing issues are resolved.
 
 from __future__ import annotations
 
+import secrets
+import time
+from collections import deque
+from collections.abc import Callable
 from enum import Enum, auto
 
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import (
+    QCoreApplication,
+    QObject,
+    QSettings,
+    QThread,
+    QTimer,
+    Signal,
+    Slot,
+)
 from PySide6.QtSerialPort import QSerialPort, QSerialPortInfo
 
+from flipflops.frame import Frame, Geometry
+from flipflops.scheduler import Pulse, Scheduler, Timings
+from flipflops.telemetry import Statistics, Telemetry
+
+_BASE_BAUD_RATE = 9600
+_BAUD_RATES = [1000000, 230400, 115200]
+
+
+class _Handshake(Enum):
+    NONE = auto()
+    CAPS = auto()
+    BAUD = auto()
+    ECHO = auto()
+    REVERT = auto()
+
 
 class Display(QObject):
     class RawRow(Enum):
@@ -35,17 +61,6 @@ class Display(QObject):
                 case Display.RawCol.ON_WHITE:
                     return b"1"
 
-    class Dot(Enum):
-        BLACK = auto()
-        WHITE = auto()
-
-        def __bytes__(self) -> bytes:
-            match self:
-                case Display.Dot.BLACK:
-                    return b"0"
-                case Display.Dot.WHITE:
-                    return b"1"
-
     on_open: Signal = Signal()
     on_close: Signal = Signal()
     on_read: Signal = Signal(bytes)
@@ -53,65 +68,598 @@ class Display(QObject):
     on_error: Signal = Signal(QSerialPort.SerialPortError)
     on_ready: Signal = Signal()
     on_done: Signal = Signal()
+    on_writable: Signal = Signal()
+    on_geometry_change: Signal = Signal(Geometry)
+    on_statistics: Signal = Signal(Statistics)
+    on_export: Signal = Signal(str, str)
+    on_calibrated: Signal = Signal(Timings)
+
+    _request_open: Signal = Signal(object, object)
+    _request_close: Signal = Signal()
+    _request_write: Signal = Signal(bytes)
+    _request_abort: Signal = Signal()
+    _request_force: Signal = Signal(bool)
+    _request_display: Signal = Signal(Frame)
+    _request_raw: Signal = Signal(object, object)
+    _request_frame: Signal = Signal(Frame)
+    _request_submit: Signal = Signal(Frame)
+    _request_depth: Signal = Signal(int)
+    _request_geometry: Signal = Signal(Geometry)
+    _request_export: Signal = Signal(str)
+    _request_calibrate: Signal = Signal()
+    _request_max_coils: Signal = Signal(object)
 
     def __init__(self) -> None:
         super().__init__()
 
+        self._open: bool = False
+        self._capabilities: frozenset[bytes] = frozenset()
+        self._baud_rate: int = 0
+        self._geometry: Geometry = Geometry(6, 6)
+        self._ready: bool = False
+        self._frames_in_flight: int = 0
+        self._depth: int = 1
+        self._superseded: int = 0
+        self._requested: int = 0
+        self._committed: Frame | None = None
+        self._skipped: int = 0
+        self._statistics: Statistics = Statistics(0, 0, 0, 0, 0, 0, 0)
+
+        self._thread: QThread = QThread()
+        self._thread.setObjectName("Display")
+
+        self._transport: _Transport = _Transport(self._geometry)
+        self._transport.moveToThread(self._thread)
+        self._thread.finished.connect(self._transport.deleteLater)
+
+        self._request_open.connect(self._transport.open)
+        self._request_close.connect(self._transport.close)
+        self._request_write.connect(self._transport.write)
+        self._request_abort.connect(self._transport.write_abort)
+        self._request_force.connect(self._transport.write_force)
+        self._request_display.connect(self._transport.write_display)
+        self._request_raw.connect(self._transport.write_raw)
+        self._request_frame.connect(self._transport.write_frame)
+        self._request_submit.connect(self._transport.submit)
+        self._request_depth.connect(self._transport.set_depth)
+        self._request_geometry.connect(self._transport.set_geometry)
+        self._request_export.connect(self._transport.export_telemetry)
+        self._request_calibrate.connect(self._transport.calibrate)
+        self._request_max_coils.connect(self._transport.set_max_coils)
+
+        self._transport.on_open.connect(self._handle_open)
+        self._transport.on_close.connect(self._handle_close)
+        self._transport.on_read.connect(self.on_read)
+        self._transport.on_write.connect(self.on_write)
+        self._transport.on_error.connect(self.on_error)
+        self._transport.on_ready.connect(self._handle_ready)
+        self._transport.on_done.connect(self.on_done)
+        self._transport.on_writable.connect(self._handle_writable)
+        self._transport.on_status.connect(self._handle_status)
+        self._transport.on_geometry_change.connect(self._handle_geometry_change)
+        self._transport.on_statistics.connect(self._handle_statistics)
+        self._transport.on_export.connect(self.on_export)
+        self._transport.on_calibrated.connect(self.on_calibrated)
+
+        self._thread.start()
+
+        application = QCoreApplication.instance()
+        assert application is not None
+        application.aboutToQuit.connect(self._handle_quit)
+
+    def capabilities(self) -> frozenset[bytes]:
+        return self._capabilities
+
+    def geometry(self) -> Geometry:
+        return self._geometry
+
+    def set_geometry(self, geometry: Geometry) -> None:
+        if geometry == self._geometry:
+            return
+
+        self._geometry = geometry
+        self._committed = None
+        self._request_geometry.emit(geometry)
+        self.on_geometry_change.emit(geometry)
+
+    def blank(self) -> Frame:
+        return Frame(self._geometry)
+
+    def depth(self) -> int:
+        return self._depth
+
+    def set_depth(self, depth: int) -> None:
+        assert depth >= 1
+        self._request_depth.emit(depth)
+
+    def superseded(self) -> int:
+        return self._superseded
+
+    def skipped(self) -> int:
+        return self._skipped
+
+    def set_max_coils(self, max_coils: int | None) -> None:
+        assert max_coils is None or max_coils >= 1
+        self._request_max_coils.emit(max_coils)
+
+    def calibrate(self) -> None:
+        if not self._ready:
+            return
+
+        self._committed = None
+        self._request_calibrate.emit()
+
+    # NOTE: Latest wins, and a repeat of the last frame is skipped without a credit.
+    def submit(self, frame: Frame) -> bool:
+        assert frame.geometry() == self._geometry
+
+        if frame == self._committed:
+            self._skipped += 1
+            return False
+
+        self._committed = frame
+        self._request_submit.emit(frame)
+        return True
+
+    def can_write(self) -> bool:
+        return self._ready and self._frames_in_flight < self._depth
+
+    def statistics(self) -> Statistics:
+        return self._statistics
+
+    def export_telemetry(self, path: str) -> None:
+        self._request_export.emit(path)
+
+    def baud_rate(self) -> int:
+        assert self._open
+        return self._baud_rate
+
+    def open(self, port: QSerialPortInfo | str, baud_rate: int | None = None) -> None:
+        assert not self._open
+
+        self._open = True
+        self._request_open.emit(port, baud_rate)
+
+    def write_abort(self) -> None:
+        self._committed = None
+        self._request_abort.emit()
+
+    def write_force(self, force: bool) -> None:
+        self._request_force.emit(force)
+
+    def write_display(self, frame: Frame) -> None:
+        assert frame.geometry() == self._geometry
+
+        self._frames_in_flight += 1
+        self._requested += 1
+        self._committed = frame
+        self._request_display.emit(frame)
+
+    def write_raw(self, rows: list[RawRow], cols: list[RawCol]) -> None:
+        self._frames_in_flight += 1
+        self._requested += 1
+        self._committed = None
+        self._request_raw.emit(rows, cols)
+
+    def write_frame(self, frame: Frame) -> None:
+        assert frame.geometry() == self._geometry
+
+        self._frames_in_flight += 1
+        self._requested += 1
+        self._committed = frame
+        self._request_frame.emit(frame)
+
+    def write(self, value: bytes) -> None:
+        self._committed = None
+        self._request_write.emit(value)
+
+    def close(self) -> None:
+        assert self._open
+        self._request_close.emit()
+
+    @Slot()
+    def _handle_open(self) -> None:
+        self.on_open.emit()
+
+    @Slot()
+    def _handle_close(self) -> None:
+        self._open = False
+        self._capabilities = frozenset()
+        self._baud_rate = 0
+        self._ready = False
+        self._frames_in_flight = 0
+        self._committed = None
+        self.on_close.emit()
+
+    @Slot(object, int)
+    def _handle_ready(self, capabilities: frozenset[bytes], baud_rate: int) -> None:
+        self._capabilities = capabilities
+        self._baud_rate = baud_rate
+        self._committed = None
+        self.on_ready.emit()
+
+    @Slot()
+    def _handle_writable(self) -> None:
+        if self.can_write():
+            self.on_writable.emit()
+
+    # NOTE: A report can predate writes that were already requested here, so
+    #       the credits those writes took are added back on top of it.
+    @Slot(bool, int, int, int, int)
+    def _handle_status(
+        self,
+        ready: bool,
+        frames_in_flight: int,
+        depth: int,
+        superseded: int,
+        received: int,
+    ) -> None:
+        self._ready = ready
+        self._frames_in_flight = frames_in_flight + self._requested - received
+        self._depth = depth
+        self._superseded = superseded
+
+    @Slot(Geometry)
+    def _handle_geometry_change(self, geometry: Geometry) -> None:
+        if geometry == self._geometry:
+            return
+
+        self._geometry = geometry
+        self._committed = None
+        self.on_geometry_change.emit(geometry)
+
+    @Slot(Statistics)
+    def _handle_statistics(self, statistics: Statistics) -> None:
+        self._statistics = statistics
+        self.on_statistics.emit(statistics)
+
+    @Slot()
+    def _handle_quit(self) -> None:
+        self._thread.quit()
+        self._thread.wait()
+
+
+class _Transport(QObject):
+    on_open: Signal = Signal()
+    on_close: Signal = Signal()
+    on_read: Signal = Signal(bytes)
+    on_write: Signal = Signal(bytes)
+    on_error: Signal = Signal(QSerialPort.SerialPortError)
+    on_ready: Signal = Signal(object, int)
+    on_done: Signal = Signal()
+    on_writable: Signal = Signal()
+    on_status: Signal = Signal(bool, int, int, int, int)
+    on_geometry_change: Signal = Signal(Geometry)
+    on_statistics: Signal = Signal(Statistics)
+    on_export: Signal = Signal(str, str)
+    on_calibrated: Signal = Signal(Timings)
+
+    def __init__(self, geometry: Geometry) -> None:
+        super().__init__()
+
         self._port: QSerialPort | None = None
+        self._capabilities: frozenset[bytes] = frozenset()
+        self._handshake: _Handshake = _Handshake.NONE
+        self._negotiate: bool = False
+        self._baud_rates: list[int] = []
+        self._echo: bytes = b""
+        self._port_key: str = ""
+        self._geometry: Geometry = geometry
+        self._frame: Frame | None = None
+        self._ready: bool = False
+        self._depth: int = 2
+        self._sequence: int = 0
+        self._in_flight: deque[tuple[int, bool]] = deque()
+        self._frames_in_flight: int = 0
+        self._latest: Frame | None = None
+        self._superseded: int = 0
+        self._received: int = 0
+        self._held: deque[Callable[[], None]] = deque()
+        self._telemetry: Telemetry = Telemetry()
+        self._scheduler: Scheduler = Scheduler(geometry)
+        self._calibration: deque[tuple[bytes, int]] = deque()
+        self._calibrating: bool = False
+        self._calibration_step: tuple[bytes, int, float] | None = None
+        self._samples: dict[int, list[float]] = {}
+
+        self._handshake_timer: QTimer = QTimer(self, singleShot=True, interval=500)
+        self._handshake_timer.timeout.connect(self._handle_handshake_timeout)
+
+        self._statistics_timer: QTimer = QTimer(self, interval=500)
+        self._statistics_timer.timeout.connect(self._handle_statistics_timeout)
+
+    @Slot(Geometry)
+    def set_geometry(self, geometry: Geometry) -> None:
+        if geometry == self._geometry:
+            return
+
+        self._geometry = geometry
+        self._frame = None
+        self._latest = None
+        self._scheduler.set_geometry(geometry)
+        self.on_geometry_change.emit(geometry)
+
+    # NOTE: Firmware with "queue=N" buffers N frames while another one flips.
+    def depth(self) -> int:
+        for capability in self._capabilities:
+            if capability.startswith(b"queue="):
+                return min(self._depth, int(capability.removeprefix(b"queue=")) + 1)
+
+        return 1
+
+    @Slot(int)
+    def set_depth(self, depth: int) -> None:
+        self._depth = depth
+        self._release()
+
+    @Slot(Frame)
+    def submit(self, frame: Frame) -> None:
+        if self._stale(frame):
+            return
+
+        if self._latest is not None:
+            self._superseded += 1
+
+        self._latest = frame
+        self._release()
+
+    def can_write(self) -> bool:
+        return (
+            self._ready
+            and not self._calibrating
+            and self._frames_in_flight < self.depth()
+        )
+
+    @Slot(object)
+    def set_max_coils(self, max_coils: int | None) -> None:
+        self._scheduler.set_max_coils(max_coils)
+
+    @Slot()
+    def calibrate(self) -> None:
+        if not self._ready or self._calibrating:
+            return
+
+        geometry = self._geometry
+        columns = (1 << geometry.width) - 1
+        black = Frame(geometry)
+
+        self._calibration.clear()
+        self._calibration.append((b"", -1))
+
+        for r in range(geometry.height):
+            for pulse in [Pulse(1 << r, columns, 0), Pulse(1 << r, 0, columns)]:
+                self._calibration.append((self._encode_pulse(pulse), r))
+
+        self._calibration.append((self._encode_display(~black), geometry.height))
+        self._calibration.append((self._encode_display(black), geometry.height))
 
-    def open(self, info: QSerialPortInfo) -> None:
+        self._calibrating = True
+        self._samples = {}
+        self._report()
+
+        if self._frames_in_flight == 0:
+            self._continue_calibration()
+
+    @Slot(object, object)
+    def open(self, port: QSerialPortInfo | str, baud_rate: int | None = None) -> None:
         assert self._port is None
 
+        if isinstance(port, QSerialPortInfo):
+            self._port_key = port.serialNumber() or port.portName()
+        else:
+            self._port_key = port
+
+        self._negotiate = baud_rate is None
+
+        if baud_rate is None:
+            remembered = _remembered_baud_rate(self._port_key)
+            self._baud_rates = [rate for rate in _BAUD_RATES if rate != remembered]
+
+            if remembered is not None and remembered != _BASE_BAUD_RATE:
+                self._baud_rates.insert(0, remembered)
+
         self._port = QSerialPort(
-            info,
-            baudRate=QSerialPort.BaudRate.Baud9600,
+            port,
+            baudRate=_BASE_BAUD_RATE if baud_rate is None else baud_rate,
             dataBits=QSerialPort.DataBits.Data8,
             flowControl=QSerialPort.FlowControl.NoFlowControl,
             parity=QSerialPort.Parity.NoParity,
             stopBits=QSerialPort.StopBits.OneStop,
         )
 
+        self._superseded = 0
+        self._telemetry.reset(self._port.baudRate())
+        self._statistics_timer.start()
+
         self._port.open(QSerialPort.OpenModeFlag.ReadWrite)
         self._port.readyRead.connect(self._handle_read)
+        self._port.bytesWritten.connect(self._handle_bytes_written)
         self._port.errorOccurred.connect(self._handle_error)
         self.on_open.emit()
 
+    @Slot()
     def write_abort(self) -> None:
         self.write(b"abort")
 
+        self._in_flight.clear()
+        self._frames_in_flight = 0
+        self._held.clear()
+        self._telemetry.abort()
+        self._release()
+
+    @Slot(bool)
     def write_force(self, force: bool) -> None:
-        self.write(b"force: " + b"on" if force else b"off")
+        self._write(b"force: " + (b"on" if force else b"off"))
+
+    @Slot(Frame)
+    def write_display(self, frame: Frame) -> None:
+        self._hold(lambda: self._write_display(frame))
+
+    @Slot(object, object)
+    def write_raw(self, rows: list[Display.RawRow], cols: list[Display.RawCol]) -> None:
+        self._hold(lambda: self._write_raw(rows, cols))
+
+    @Slot(Frame)
+    def write_frame(self, frame: Frame) -> None:
+        self._hold(lambda: self._write_frame(frame))
+
+    def _hold(self, write: Callable[[], None]) -> None:
+        self._received += 1
+
+        if len(self._held) == 0 and self.can_write():
+            write()
+        else:
+            self._held.append(write)
+            self._report()
+
+    def _write_display(self, frame: Frame) -> None:
+        if self._stale(frame):
+            return
+
+        self._send(self._encode_display(frame), True)
+        self._frame = frame
+
+    def _write_raw(
+        self, rows: list[Display.RawRow], cols: list[Display.RawCol]
+    ) -> None:
+        assert len(rows) == self._geometry.height
+        assert len(cols) == self._geometry.width
+
+        pulse = Pulse(
+            sum(1 << r for r, row in enumerate(rows) if row == Display.RawRow.ON),
+            sum(1 << c for c, col in enumerate(cols) if col == Display.RawCol.ON_WHITE),
+            sum(1 << c for c, col in enumerate(cols) if col == Display.RawCol.ON_BLACK),
+        )
 
-    def write_display(self, dots: list[Dot]) -> None:
-        assert len(dots) == 36
-        self.write(b"display: " + b"".join(bytes(dot) for dot in dots))
+        self._send(self._encode_pulse(pulse), True)
+        self._apply_pulse(pulse)
 
-    def write_raw(self, rows: list[RawRow], cols: list[RawCol]) -> None:
-        assert len(rows) == 6
-        assert len(cols) == 6
+    def _write_frame(self, frame: Frame) -> None:
+        if self._stale(frame):
+            return
 
-        self.write(
-            b"raw: "
-            + b"".join(bytes(row) for row in rows)
-            + b"".join(bytes(col) for col in cols)
+        if self._frame is None:
+            self.write_force(True)
+            self._write_display(frame)
+            self.write_force(False)
+            return
+
+        changed = (self._frame ^ frame).count()
+
+        if changed == 0:
+            self._frames_in_flight += 1
+            self._report()
+            QTimer.singleShot(0, self._finish_frame)
+            return
+
+        display_time = self._scheduler.display_time(
+            len(self._encode_display(frame)), changed
         )
+        pulses = self._scheduler.schedule(self._frame, frame, display_time)
+
+        if pulses is None:
+            self._write_display(frame)
+            return
+
+        for index, pulse in enumerate(pulses):
+            self._send(self._encode_pulse(pulse), index == len(pulses) - 1)
+            self._apply_pulse(pulse)
 
+    @Slot(bytes)
     def write(self, value: bytes) -> None:
-        assert self._port is not None
+        self._frame = None
+        self._write(value)
+
+    def _send(self, value: bytes, ends_frame: bool) -> None:
+        if self._port is None:
+            return
+
+        self._write(value)
+        self._telemetry.track(ends_frame)
+        self._in_flight.append((self._sequence, ends_frame))
+        self._sequence = (self._sequence + 1) % 256
+
+        if ends_frame:
+            self._frames_in_flight += 1
+            self._report()
+
+    def _stale(self, frame: Frame) -> bool:
+        if frame.geometry() == self._geometry:
+            return False
+
+        self._release()
+        return True
+
+    def _write(self, value: bytes) -> None:
+        if self._port is None:
+            return
 
         self._port.write(value + b"\n")
+        self._telemetry.record_write(value)
         self.on_write.emit(value)
 
+    def _apply_pulse(self, pulse: Pulse) -> None:
+        if self._frame is None:
+            return
+
+        bits = self._frame.bits()
+
+        for r in range(self._geometry.height):
+            if pulse.rows >> r & 1 == 1:
+                shift = r * self._geometry.width
+                bits = (bits | pulse.white << shift) & ~(pulse.black << shift)
+
+        self._frame = Frame(self._geometry, bits)
+
+    def _encode_display(self, frame: Frame) -> bytes:
+        if b"packed" in self._capabilities:
+            return b"#" + frame.pack()
+        else:
+            return b"display: " + frame.ascii()
+
+    def _encode_pulse(self, pulse: Pulse) -> bytes:
+        rows = [
+            Display.RawRow.ON if pulse.rows >> r & 1 else Display.RawRow.OFF
+            for r in range(self._geometry.height)
+        ]
+        cols = [
+            (
+                Display.RawCol.ON_WHITE
+                if pulse.white >> c & 1
+                else (
+                    Display.RawCol.ON_BLACK
+                    if pulse.black >> c & 1
+                    else Display.RawCol.OFF
+                )
+            )
+            for c in range(self._geometry.width)
+        ]
+
+        return (
+            b"raw: "
+            + b"".join(bytes(row) for row in rows)
+            + b"".join(bytes(col) for col in cols)
+        )
+
+    @Slot()
     def close(self) -> None:
-        assert self._port is not None
+        if self._port is None:
+            return
 
         self._port.readyRead.disconnect(self._handle_read)
+        self._port.bytesWritten.disconnect(self._handle_bytes_written)
         self._port.errorOccurred.disconnect(self._handle_error)
 
         if self._port.isOpen():
             self._port.close()
 
         self._port = None
+        self._reset()
+        self._capabilities = frozenset()
+        self._handshake = _Handshake.NONE
+        self._handshake_timer.stop()
+        self._statistics_timer.stop()
+        self._report()
         self.on_close.emit()
 
     @Slot()
@@ -122,10 +670,238 @@ class Display(QObject):
             line = bytes(self._port.readLine().data()).removesuffix(b"\n")
             self.on_read.emit(line)
 
-            if line == b"ready":
-                self.on_ready.emit()
-            elif line == b"done":
-                self.on_done.emit()
+            if self._handshake != _Handshake.NONE:
+                self._continue_handshake(line)
+            elif line == b"ready":
+                self._reset()
+                self._report()
+                self._start_handshake()
+            elif line == b"done" or line.startswith(b"done "):
+                self._handle_done(line.removeprefix(b"done").strip())
+
+    def _handle_done(self, sequence: bytes) -> None:
+        if len(self._in_flight) == 0:
+            # NOTE: Commands typed into the console are not tracked.
+            self.on_done.emit()
+            return
+
+        expected, ends_frame = self._in_flight.popleft()
+        self._telemetry.record_done()
+
+        if len(sequence) > 0 and int(sequence) != expected:
+            # NOTE: The firmware counted a command the window did not, so follow
+            #       its numbering and stop trusting the dots on the display.
+            shift = int(sequence) - expected
+            self._sequence = (self._sequence + shift) % 256
+            self._in_flight = deque(
+                ((number + shift) % 256, ends) for number, ends in self._in_flight
+            )
+            self._frame = None
+
+        if ends_frame:
+            self._finish_frame()
+
+    @Slot()
+    def _finish_frame(self) -> None:
+        if self._frames_in_flight == 0:
+            return
+
+        self._frames_in_flight -= 1
+        self.on_done.emit()
+
+        if self._calibrating:
+            self._continue_calibration()
+        else:
+            self._release()
+
+    def _release(self) -> None:
+        while len(self._held) > 0 and self.can_write():
+            self._held.popleft()()
+
+        if len(self._held) == 0 and self._latest is not None and self.can_write():
+            frame = self._latest
+            self._latest = None
+            self._write_frame(frame)
+
+        self._report()
+
+        if len(self._held) == 0 and self.can_write():
+            self.on_writable.emit()
+
+    def _report(self) -> None:
+        self.on_status.emit(
+            self._ready and not self._calibrating,
+            self._frames_in_flight + len(self._held),
+            self.depth(),
+            self._superseded,
+            self._received,
+        )
+
+    def _continue_calibration(self) -> None:
+        if self._frames_in_flight > 0:
+            return
+
+        if self._calibration_step is not None:
+            value, key, start = self._calibration_step
+            elapsed = time.perf_counter() - start
+            wire = (len(value) + 1) * 10 / self._port_baud_rate()
+            self._samples.setdefault(key, []).append(max(0, elapsed - wire))
+            self._calibration_step = None
+
+        if len(self._calibration) == 0:
+            self._finish_calibration()
+            return
+
+        value, key = self._calibration.popleft()
+
+        if key == -1:
+            self.write_force(True)
+            self._write_display(Frame(self._geometry))
+            self.write_force(False)
+            return
+
+        self._calibration_step = (value, key, time.perf_counter())
+        self._send(value, True)
+
+    def _finish_calibration(self) -> None:
+        geometry = self._geometry
+        rows = tuple(
+            sum(self._samples[r]) / len(self._samples[r])
+            for r in range(geometry.height)
+        )
+        dot = sum(self._samples[geometry.height]) / (2 * geometry.dots())
+        timings = Timings(rows, dot)
+
+        self._frame = Frame(geometry)
+        self._scheduler.set_timings(timings)
+        _remember_timings(self._port_key, geometry, timings)
+
+        self._calibrating = False
+        self.on_calibrated.emit(timings)
+        self._release()
+
+    def _port_baud_rate(self) -> int:
+        return _BASE_BAUD_RATE if self._port is None else self._port.baudRate()
+
+    def _reset(self) -> None:
+        self._frame = None
+        self._ready = False
+        self._sequence = 0
+        self._in_flight.clear()
+        self._frames_in_flight = 0
+        self._latest = None
+        self._held.clear()
+        self._telemetry.abort()
+        self._calibration.clear()
+        self._calibrating = False
+        self._calibration_step = None
+
+    def _start_handshake(self) -> None:
+        self._capabilities = frozenset()
+        self._handshake = _Handshake.CAPS
+        self._handshake_timer.start(500)
+        self._write(b"caps")
+
+    def _continue_handshake(self, line: bytes) -> None:
+        assert self._port is not None
+
+        match self._handshake:
+            case _Handshake.CAPS:
+                if line.startswith(b"caps: "):
+                    self._capabilities = frozenset(line.removeprefix(b"caps: ").split())
+
+                if self._negotiate and b"baud" in self._capabilities:
+                    self._try_baud_rate()
+                else:
+                    self._finish_handshake()
+            case _Handshake.BAUD if line == b"baud: ok":
+                self._port.setBaudRate(self._baud_rates[0])
+                self._port.clear(QSerialPort.Direction.Input)
+
+                self._echo = secrets.token_hex(4).encode("ascii")
+                self._handshake = _Handshake.ECHO
+                self._handshake_timer.start(500)
+                self._write(b"echo: " + self._echo)
+            case _Handshake.ECHO if line == b"echo: " + self._echo:
+                _remember_baud_rate(self._port_key, self._baud_rates[0])
+                self._finish_handshake()
+            case _Handshake.BAUD | _Handshake.ECHO:
+                self._revert_baud_rate()
+            case _Handshake.REVERT:
+                pass
+
+    def _try_baud_rate(self) -> None:
+        assert self._port is not None
+
+        if len(self._baud_rates) == 0:
+            self._finish_handshake()
+            return
+
+        self._handshake = _Handshake.BAUD
+        self._handshake_timer.start(500)
+        self._write(f"baud: {self._baud_rates[0]}".encode("ascii"))
+
+    # NOTE: Firmware reverts to 9600 a second after a switch without a good echo.
+    def _revert_baud_rate(self) -> None:
+        assert self._port is not None
+
+        self._port.setBaudRate(_BASE_BAUD_RATE)
+        self._port.clear(QSerialPort.Direction.Input)
+        self._baud_rates.pop(0)
+        self._handshake = _Handshake.REVERT
+        self._handshake_timer.start(1500)
+
+    def _finish_handshake(self) -> None:
+        assert self._port is not None
+
+        self._handshake = _Handshake.NONE
+        self._handshake_timer.stop()
+        self._ready = True
+        self._telemetry.set_baud_rate(self._port.baudRate())
+        self._scheduler.set_baud_rate(self._port.baudRate())
+
+        for capability in self._capabilities:
+            if capability.startswith(b"size="):
+                width, _, height = capability.removeprefix(b"size=").partition(b"x")
+                self.set_geometry(Geometry(int(width), int(height)))
+
+        timings = _remembered_timings(self._port_key, self._geometry)
+
+        if timings is not None:
+            self._scheduler.set_timings(timings)
+
+        self._report()
+        self.on_ready.emit(self._capabilities, self._port.baudRate())
+        self._release()
+
+    @Slot()
+    def _handle_handshake_timeout(self) -> None:
+        match self._handshake:
+            case _Handshake.CAPS:
+                self._finish_handshake()
+            case _Handshake.BAUD | _Handshake.ECHO:
+                self._revert_baud_rate()
+            case _Handshake.REVERT:
+                self._try_baud_rate()
+            case _Handshake.NONE:
+                pass
+
+    @Slot(int)
+    def _handle_bytes_written(self, count: int) -> None:
+        self._telemetry.record_wire(count)
+
+    @Slot()
+    def _handle_statistics_timeout(self) -> None:
+        self.on_statistics.emit(self._telemetry.statistics())
+
+    @Slot(str)
+    def export_telemetry(self, path: str) -> None:
+        try:
+            self._telemetry.export(path)
+        except OSError as error:
+            self.on_export.emit(path, error.strerror or str(error))
+        else:
+            self.on_export.emit(path, "")
 
     @Slot(QSerialPort.SerialPortError)
     def _handle_error(self, error: QSerialPort.SerialPortError) -> None:
@@ -133,3 +909,30 @@ class Display(QObject):
 
         self.close()
         self.on_error.emit(error)
+
+
+def _remembered_baud_rate(port_key: str) -> int | None:
+    value = QSettings().value(f"baud_rates/{port_key.replace('/', '_')}")
+    return None if value is None else int(value)
+
+
+def _remember_baud_rate(port_key: str, baud_rate: int) -> None:
+    QSettings().setValue(f"baud_rates/{port_key.replace('/', '_')}", baud_rate)
+
+
+def _remembered_timings(port_key: str, geometry: Geometry) -> Timings | None:
+    key = f"timings/{port_key.replace('/', '_')}/{geometry.width}x{geometry.height}"
+    value = QSettings().value(key)
+
+    if value is None:
+        return None
+
+    *rows, dot = (float(seconds) for seconds in str(value).split(","))
+    return Timings(tuple(rows), dot)
+
+
+def _remember_timings(port_key: str, geometry: Geometry, timings: Timings) -> None:
+    key = f"timings/{port_key.replace('/', '_')}/{geometry.width}x{geometry.height}"
+    QSettings().setValue(
+        key, ",".join(str(seconds) for seconds in [*timings.rows, timings.dot])
+    )
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, qGray
+
+_BINARY = bytes([ord("0")] + [ord("1")] * 255)
+
+
+class Geometry(NamedTuple):
+    width: int
+    height: int
+
+    def dots(self) -> int:
+        return self.width * self.height
+
+    def __str__(self) -> str:
+        return f"{self.width} × {self.height}"
+
+
+# NOTE: Dot (row, col) lives in bit row * width + col, and a set bit is white.
+class Frame:
+    __slots__ = ("_geometry", "_bits")
+
+    def __init__(self, geometry: Geometry, bits: int = 0) -> None:
+        assert 0 <= bits < 1 << geometry.dots()
+
+        self._geometry: Geometry = geometry
+        self._bits: int = bits
+
+    @staticmethod
+    def from_ascii(geometry: Geometry, value: str | bytes) -> Frame:
+        assert len(value) == geometry.dots()
+        return Frame(geometry, int(value[::-1], 2))
+
+    @staticmethod
+    def from_rows(geometry: Geometry, rows: list[int]) -> Frame:
+        assert len(rows) == geometry.height
+
+        bits = 0
+
+        for row in reversed(rows):
+            bits = (bits << geometry.width) | row
+
+        return Frame(geometry, bits)
+
+    @staticmethod
+    def from_buffer(geometry: Geometry, data: object, stride: int = 0) -> Frame:
+        view = memoryview(data).cast("B")  # type: ignore[arg-type]
+        stride = stride or geometry.width
+
+        assert len(view) >= stride * (geometry.height - 1) + geometry.width
+
+        if stride == geometry.width:
+            dots = bytes(view[: geometry.dots()])
+        else:
+            dots = b"".join(
+                view[r * stride : r * stride + geometry.width]
+                for r in range(geometry.height)
+            )
+
+        return Frame(geometry, int(dots.translate(_BINARY)[::-1], 2))
+
+    @staticmethod
+    def from_image(image: QImage) -> Frame:
+        geometry = Geometry(image.width(), image.height())
+
+        if image.format() != QImage.Format.Format_MonoLSB:
+            image = image.convertToFormat(
+                QImage.Format.Format_MonoLSB, Qt.ImageConversionFlag.ThresholdDither
+            )
+
+        data = image.constBits()
+        stride = image.bytesPerLine()
+        length = (geometry.width + 7) // 8
+        mask = (1 << geometry.width) - 1
+        invert = qGray(image.color(1)) < 128
+
+        rows = []
+
+        for r in range(geometry.height):
+            row = int.from_bytes(data[r * stride : r * stride + length], "little")
+            rows.append((~row if invert else row) & mask)
+
+        return Frame.from_rows(geometry, rows)
+
+    def geometry(self) -> Geometry:
+        return self._geometry
+
+    def bits(self) -> int:
+        return self._bits
+
+    def dot(self, row: int, col: int) -> bool:
+        return (self._bits >> (row * self._geometry.width + col)) & 1 == 1
+
+    def row(self, row: int) -> int:
+        width = self._geometry.width
+        return (self._bits >> (row * width)) & ((1 << width) - 1)
+
+    def count(self) -> int:
+        return self._bits.bit_count()
+
+    def with_dot(self, row: int, col: int, white: bool) -> Frame:
+        mask = 1 << (row * self._geometry.width + col)
+        return Frame(self._geometry, self._bits | mask if white else self._bits & ~mask)
+
+    def ascii(self) -> bytes:
+        return format(self._bits, f"0{self._geometry.dots()}b")[::-1].encode("ascii")
+
+    # NOTE: Dot i is stored in bit i % 8 of byte i // 8, so the firmware reads
+    #       exactly ceil(dots / 8) bytes after the "#" header.
+    def pack(self) -> bytes:
+        return self._bits.to_bytes((self._geometry.dots() + 7) // 8, "little")
+
+    def fit(self, geometry: Geometry) -> Frame:
+        if geometry == self._geometry:
+            return self
+
+        source = self._geometry
+        scale = max(
+            1, min(geometry.width // source.width, geometry.height // source.height)
+        )
+        x = (geometry.width - source.width * scale) // 2
+        y = (geometry.height - source.height * scale) // 2
+
+        rows = [0] * geometry.height
+
+        for r in range(source.height):
+            row = 0
+
+            for c in range(source.width - 1, -1, -1):
+                row <<= scale
+
+                if self.dot(r, c):
+                    row |= (1 << scale) - 1
+
+            row = row << x if x >= 0 else row >> -x
+            row &= (1 << geometry.width) - 1
+
+            for offset in range(scale):
+                target = y + r * scale + offset
+
+                if 0 <= target < geometry.height:
+                    rows[target] = row
+
+        return Frame.from_rows(geometry, rows)
+
+    def __xor__(self, other: Frame) -> Frame:
+        assert self._geometry == other._geometry
+        return Frame(self._geometry, self._bits ^ other._bits)
+
+    def __and__(self, other: Frame) -> Frame:
+        assert self._geometry == other._geometry
+        return Frame(self._geometry, self._bits & other._bits)
+
+    def __or__(self, other: Frame) -> Frame:
+        assert self._geometry == other._geometry
+        return Frame(self._geometry, self._bits | other._bits)
+
+    def __invert__(self) -> Frame:
+        return Frame(self._geometry, ~self._bits & ((1 << self._geometry.dots()) - 1))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Frame):
+            return NotImplemented
+
+        return self._geometry == other._geometry and self._bits == other._bits
+
+    def __hash__(self) -> int:
+        return hash((self._geometry, self._bits))
+
+    def __repr__(self) -> str:
+        return f"Frame({self._geometry!r}, {self._bits:#x})"
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import bisect
+import math
+import random
+from abc import ABC, abstractmethod
+from collections import deque
+from enum import Enum, auto
+
+from PySide6.QtCore import QObject, QTimer, Slot
+
+from flipflops.frame import Frame, Geometry
+
+_BAYER = [[0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]]
+
+
+class Generator(ABC):
+    class Kind(Enum):
+        RANDOM = auto()
+        LIFE = auto()
+        PLASMA = auto()
+        GRADIENT = auto()
+        RAIN = auto()
+        WIPE = auto()
+
+        def __str__(self) -> str:
+            match self:
+                case Generator.Kind.RANDOM:
+                    return "Random Dots"
+                case Generator.Kind.LIFE:
+                    return "Game of Life"
+                case Generator.Kind.PLASMA:
+                    return "Plasma"
+                case Generator.Kind.GRADIENT:
+                    return "Scrolling Gradient"
+                case Generator.Kind.RAIN:
+                    return "Rain"
+                case Generator.Kind.WIPE:
+                    return "Wipes"
+
+    def __init__(self, geometry: Geometry) -> None:
+        self._geometry: Geometry = geometry
+        self._full: int = (1 << geometry.dots()) - 1
+
+        self._rows: int = sum(1 << (r * geometry.width) for r in range(geometry.height))
+
+    @staticmethod
+    def create(kind: Generator.Kind, geometry: Geometry) -> Generator:
+        match kind:
+            case Generator.Kind.RANDOM:
+                return RandomDots(geometry)
+            case Generator.Kind.LIFE:
+                return Life(geometry)
+            case Generator.Kind.PLASMA:
+                return Plasma(geometry)
+            case Generator.Kind.GRADIENT:
+                return Gradient(geometry)
+            case Generator.Kind.RAIN:
+                return Rain(geometry)
+            case Generator.Kind.WIPE:
+                return Wipe(geometry)
+
+    def geometry(self) -> Geometry:
+        return self._geometry
+
+    @abstractmethod
+    def next(self) -> Frame: ...
+
+
+class RandomDots(Generator):
+    def __init__(self, geometry: Geometry, changes: int = 1) -> None:
+        super().__init__(geometry)
+
+        self._changes: int = changes
+        self._bits: int = 0
+
+    def set_changes(self, changes: int) -> None:
+        assert changes >= 1
+        self._changes = changes
+
+    def next(self) -> Frame:
+        mask = 0
+        changes = min(self._changes, self._geometry.dots())
+
+        for index in random.sample(range(self._geometry.dots()), changes):
+            mask |= 1 << index
+
+        self._bits ^= mask
+        return Frame(self._geometry, self._bits)
+
+
+# NOTE: Neighbour counts are kept bit-sliced in three boards.
+class Life(Generator):
+    def __init__(self, geometry: Geometry) -> None:
+        super().__init__(geometry)
+
+        width = geometry.width
+        self._not_first: int = self._rows * (((1 << width) - 1) & ~1)
+        self._not_last: int = self._rows * ((1 << (width - 1)) - 1)
+
+        self._bits: int = 0
+        self._history: deque[int] = deque(maxlen=2)
+        self._seed()
+
+    def next(self) -> Frame:
+        frame = Frame(self._geometry, self._bits)
+        self._history.append(self._bits)
+        self._bits = self._step(self._bits)
+
+        if self._bits == 0 or self._bits in self._history:
+            self._seed()
+
+        return frame
+
+    def _seed(self) -> None:
+        dots = self._geometry.dots()
+        self._bits = random.getrandbits(dots) & random.getrandbits(dots)
+        self._history.clear()
+
+    def _step(self, bits: int) -> int:
+        width = self._geometry.width
+        east = (bits << 1) & self._not_first
+        west = (bits >> 1) & self._not_last
+
+        ones = 0
+        twos = 0
+        fours = 0
+
+        for neighbours in [
+            east,
+            west,
+            (east << width) & self._full,
+            (bits << width) & self._full,
+            (west << width) & self._full,
+            east >> width,
+            bits >> width,
+            west >> width,
+        ]:
+            carry = ones & neighbours
+            ones ^= neighbours
+            fours |= twos & carry
+            twos ^= carry
+
+        return twos & ~fours & (ones | bits)
+
+
+class Plasma(Generator):
+    def __init__(self, geometry: Geometry) -> None:
+        super().__init__(geometry)
+
+        self._time: float = 0
+
+    def next(self) -> Frame:
+        t = self._time
+        self._time += 0.15
+
+        columns = sorted(
+            (math.sin(c * 0.35 + t * 0.9) + math.sin(c * 0.13 - t * 0.4), c)
+            for c in range(self._geometry.width)
+        )
+        levels = [level for level, _ in columns]
+
+        prefixes = [0]
+
+        for _, c in reversed(columns):
+            prefixes.append(prefixes[-1] | 1 << c)
+
+        bits = 0
+
+        for r in range(self._geometry.height):
+            level = math.sin(r * 0.45 - t * 0.7) + math.sin(r * 0.21 + t * 0.3)
+            lit = len(levels) - bisect.bisect_right(levels, -level)
+            bits |= prefixes[lit] << (r * self._geometry.width)
+
+        return Frame(self._geometry, bits)
+
+
+class Gradient(Generator):
+    def __init__(self, geometry: Geometry) -> None:
+        super().__init__(geometry)
+
+        self._offset: int = 0
+
+        height = geometry.height
+        self._blocks: int = sum(1 << (r * geometry.width) for r in range(0, height, 4))
+
+    def next(self) -> Frame:
+        width = self._geometry.width
+        levels = [(c + self._offset) % width * 16 // width for c in range(width)]
+        self._offset = (self._offset + 1) % width
+
+        block = 0
+
+        for r in range(4):
+            row = 0
+
+            for c, level in enumerate(levels):
+                if level > _BAYER[r][c & 3]:
+                    row |= 1 << c
+
+            block |= row << (r * width)
+
+        return Frame(self._geometry, block * self._blocks & self._full)
+
+
+class Rain(Generator):
+    def __init__(self, geometry: Geometry) -> None:
+        super().__init__(geometry)
+
+        self._drops: int = 0
+
+    def next(self) -> Frame:
+        width = self._geometry.width
+        fresh = random.getrandbits(width)
+        fresh &= random.getrandbits(width) & random.getrandbits(width)
+
+        self._drops = (self._drops << width) & self._full | fresh
+        return Frame(self._geometry, self._drops | self._drops >> width)
+
+
+class Wipe(Generator):
+    class Direction(Enum):
+        RIGHT = auto()
+        DOWN = auto()
+        LEFT = auto()
+        UP = auto()
+
+    def __init__(self, geometry: Geometry) -> None:
+        super().__init__(geometry)
+
+        self._directions: deque[Wipe.Direction] = deque(Wipe.Direction)
+        self._step: int = 0
+        self._from: int = 0
+        self._to: int = self._full
+
+    def next(self) -> Frame:
+        width = self._geometry.width
+        height = self._geometry.height
+        step = self._step
+
+        match self._directions[0]:
+            case Wipe.Direction.RIGHT:
+                mask = self._rows * ((1 << step) - 1)
+                steps = width
+            case Wipe.Direction.LEFT:
+                mask = self._rows * (((1 << step) - 1) << (width - step))
+                steps = width
+            case Wipe.Direction.DOWN:
+                mask = (1 << (step * width)) - 1
+                steps = height
+            case Wipe.Direction.UP:
+                mask = self._full ^ ((1 << ((height - step) * width)) - 1)
+                steps = height
+
+        bits = self._from & ~mask | self._to & mask
+
+        if step == steps:
+            self._step = 1
+            self._from, self._to = self._to, self._from
+            self._directions.rotate(-1)
+        else:
+            self._step += 1
+
+        return Frame(self._geometry, bits)
+
+
+class Lookahead(QObject):
+    def __init__(self, generator: Generator, size: int = 4) -> None:
+        super().__init__()
+
+        assert size >= 1
+
+        self._generator: Generator = generator
+        self._size: int = size
+        self._frames: deque[Frame] = deque()
+        self._filling: bool = False
+
+        self._fill()
+
+    def generator(self) -> Generator:
+        return self._generator
+
+    def take(self) -> Frame:
+        if len(self._frames) == 0:
+            self._frames.append(self._generator.next())
+
+        frame = self._frames.popleft()
+
+        if not self._filling:
+            self._filling = True
+            QTimer.singleShot(0, self._fill)
+
+        return frame
+
+    @Slot()
+    def _fill(self) -> None:
+        self._filling = False
+
+        while len(self._frames) < self._size:
+            self._frames.append(self._generator.next())
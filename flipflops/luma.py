@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from PySide6.QtGui import QImage
+from PySide6.QtMultimedia import QVideoFrame, QVideoFrameFormat
+
+from flipflops.conversion import Converter, convert, crop, downscale
+from flipflops.frame import Frame, Geometry
+
+_LUMA_FORMATS = {
+    QVideoFrameFormat.PixelFormat.Format_YUV420P: QImage.Format.Format_Grayscale8,
+    QVideoFrameFormat.PixelFormat.Format_YUV422P: QImage.Format.Format_Grayscale8,
+    QVideoFrameFormat.PixelFormat.Format_YV12: QImage.Format.Format_Grayscale8,
+    QVideoFrameFormat.PixelFormat.Format_NV12: QImage.Format.Format_Grayscale8,
+    QVideoFrameFormat.PixelFormat.Format_NV21: QImage.Format.Format_Grayscale8,
+    QVideoFrameFormat.PixelFormat.Format_IMC1: QImage.Format.Format_Grayscale8,
+    QVideoFrameFormat.PixelFormat.Format_IMC2: QImage.Format.Format_Grayscale8,
+    QVideoFrameFormat.PixelFormat.Format_IMC3: QImage.Format.Format_Grayscale8,
+    QVideoFrameFormat.PixelFormat.Format_IMC4: QImage.Format.Format_Grayscale8,
+    QVideoFrameFormat.PixelFormat.Format_Y8: QImage.Format.Format_Grayscale8,
+    QVideoFrameFormat.PixelFormat.Format_Y16: QImage.Format.Format_Grayscale16,
+    QVideoFrameFormat.PixelFormat.Format_P010: QImage.Format.Format_Grayscale16,
+    QVideoFrameFormat.PixelFormat.Format_P016: QImage.Format.Format_Grayscale16,
+}
+
+
+def convert_video_frame(
+    frame: QVideoFrame, geometry: Geometry, converter: Converter
+) -> Frame:
+    luma = _LUMA_FORMATS.get(frame.pixelFormat())
+
+    if luma is None or not frame.map(QVideoFrame.MapMode.ReadOnly):
+        return convert(frame.toImage(), geometry, converter)
+
+    try:
+        rect = crop(frame.width(), frame.height(), geometry)
+        stride = frame.bytesPerLine(0)
+        depth = 1 if luma == QImage.Format.Format_Grayscale8 else 2
+        start = rect.y() * stride + rect.x() * depth
+
+        image = QImage(
+            memoryview(frame.bits(0))[start:],
+            rect.width(),
+            rect.height(),
+            stride,
+            luma,
+        )
+
+        image = downscale(image, geometry).copy()
+    finally:
+        frame.unmap()
+
+    return converter.convert(image)
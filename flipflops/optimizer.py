@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+from flipflops.frame import Frame
+
+
+class Report(NamedTuple):
+    frames: int
+    flips_before: int
+    flips_after: int
+    error_total: int
+    error_max: int
+
+    def saved(self) -> float:
+        return 1 - self.flips_after / self.flips_before if self.flips_before else 0
+
+    def __str__(self) -> str:
+        error_mean = self.error_total / self.frames if self.frames else 0
+
+        return "\n".join(
+            [
+                f"Frames: {self.frames}",
+                f"Flips: {self.flips_before} -> {self.flips_after}"
+                f" ({self.saved():.1%} saved)",
+                f"Wrong dots: {error_mean:.2f} per frame, {self.error_max} at most",
+            ]
+        )
+
+
+# NOTE: Keeps each frame at most budget dots from the source. Within that, a dot
+#       only follows the source after hold wrong frames in a row, and never for a
+#       change the next source frame undoes.
+class Optimizer:
+    def __init__(self, budget: int = 2, hold: int = 2) -> None:
+        assert budget >= 0
+        assert hold >= 1
+
+        self._budget: int = budget
+        self._hold: int = hold
+
+        self._frames: int = 0
+        self._flips_before: int = 0
+        self._flips_after: int = 0
+        self._error_total: int = 0
+        self._error_max: int = 0
+
+    def optimize(self, frames: Iterable[Frame]) -> Iterator[Frame]:
+        source = iter(frames)
+        target = next(source, None)
+
+        if target is None:
+            return
+
+        shown = target
+        previous = target
+        history: deque[Frame] = deque(maxlen=self._hold - 1)
+
+        while target is not None:
+            upcoming = next(source, None)
+            after = target if upcoming is None else upcoming
+
+            wrong = shown ^ target
+            flicker = wrong & ~(after ^ shown)
+            settled = wrong
+
+            for mask in history:
+                settled &= mask
+
+            flips = settled & ~flicker
+            residual = wrong & ~flips
+            excess = residual.count() - self._budget
+
+            if excess > 0:
+                for candidates in [residual & ~flicker, residual & flicker]:
+                    bits = candidates.bits()
+
+                    while excess > 0 and bits != 0:
+                        bit = bits & -bits
+                        bits ^= bit
+                        flips |= Frame(flips.geometry(), bit)
+                        excess -= 1
+
+            history.append(wrong & ~flips)
+            shown ^= flips
+
+            error = (shown ^ target).count()
+            self._frames += 1
+            self._flips_before += (previous ^ target).count()
+            self._flips_after += flips.count()
+            self._error_total += error
+            self._error_max = max(self._error_max, error)
+
+            yield shown
+
+            previous = target
+            target = upcoming
+
+    def report(self) -> Report:
+        return Report(
+            frames=self._frames,
+            flips_before=self._flips_before,
+            flips_after=self._flips_after,
+            error_total=self._error_total,
+            error_max=self._error_max,
+        )
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import cast
-
-from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtGui import QKeySequence, QShortcut
-from PySide6.QtWidgets import QGridLayout, QHBoxLayout, QPushButton, QWidget
+from PySide6.QtCore import QPoint, QRect, QRectF, Qt, Signal, Slot
+from PySide6.QtGui import (
+    QColor,
+    QKeySequence,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QPen,
+    QShortcut,
+)
+from PySide6.QtWidgets import (
+    QCheckBox,
+    QGridLayout,
+    QHBoxLayout,
+    QPushButton,
+    QWidget,
+)
 
 from flipflops.display import Display
+from flipflops.frame import Frame, Geometry
+
+_MARGIN = 30
 
 
 class Paint(QWidget):
@@ -17,9 +31,11 @@ class Paint(QWidget):
         super().__init__()
 
         self._display: Display = display
-        self._display.on_ready.connect(self._handle_ready)
-        self._display.on_done.connect(self._handle_ready)
+        self._display.on_writable.connect(self._handle_writable)
         self._display.on_close.connect(self._handle_close)
+        self._display.on_geometry_change.connect(self._handle_geometry_change)
+
+        self._pending: bool = False
 
         grid = QGridLayout()
         grid.setSpacing(5)
@@ -29,8 +45,9 @@ class Paint(QWidget):
         grid.setColumnStretch(0, 1)
         grid.setColumnStretch(2, 1)
 
-        self._canvas: _Canvas = _Canvas()
+        self._canvas: _Canvas = _Canvas(self._display.geometry())
         self._canvas.on_display.connect(self._handle_display)
+        self._canvas.on_change.connect(self._handle_change)
         grid.addWidget(self._canvas, 2, 1)
 
         hbox = QHBoxLayout()
@@ -47,6 +64,10 @@ class Paint(QWidget):
 
         hbox.addStretch(1)
 
+        self._live: QCheckBox = QCheckBox("Live")
+        self._live.toggled.connect(self._handle_live)
+        hbox.addWidget(self._live)
+
         self._display_button: QPushButton = QPushButton("Display")
         self._display_button.setEnabled(False)
         self._display_button.clicked.connect(self._handle_display)
@@ -58,83 +79,60 @@ class Paint(QWidget):
 
     @Slot()
     def _handle_display(self) -> None:
-        if not self._display_button.isEnabled():
-            return
+        if self._display_button.isEnabled():
+            self._pending = True
+            self._flush()
 
-        self._display_button.setEnabled(False)
-        self._display.write_display(self._canvas.dots())
+    @Slot()
+    def _handle_change(self) -> None:
+        if self._live.isChecked():
+            self._handle_display()
+
+    @Slot(bool)
+    def _handle_live(self, live: bool) -> None:
+        if live:
+            self._handle_display()
 
     @Slot()
-    def _handle_ready(self) -> None:
-        self._display_button.setEnabled(True)
+    def _handle_writable(self) -> None:
+        if not self._display_button.isEnabled():
+            self._display_button.setEnabled(True)
+            self._pending = self._live.isChecked()
+
+        self._flush()
 
     @Slot()
     def _handle_close(self) -> None:
+        self._pending = False
         self._display_button.setEnabled(False)
 
+    @Slot(Geometry)
+    def _handle_geometry_change(self, geometry: Geometry) -> None:
+        self._pending = False
+        self._canvas.set_geometry(geometry)
+
+    def _flush(self) -> None:
+        if self._pending and self._display.can_write():
+            self._pending = False
+            self._display.submit(self._canvas.frame())
+
 
 class _Canvas(QWidget):
     on_display: Signal = Signal()
+    on_change: Signal = Signal()
 
-    def __init__(self) -> None:
+    def __init__(self, geometry: Geometry) -> None:
         super().__init__()
 
-        grid = QGridLayout()
-
-        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-        self.setContentsMargins(30, 30, 30, 30)
-        self.setStyleSheet(
-            """
-            _Canvas {
-                background-color: black;
-
-                border-style: solid;
-                border-color: white;
-                border-width: 2px;
-                border-radius: 5px;
-            }
-
-            QPushButton {
-                min-width: 76px;
-                width: 76px;
-                max-width: 76px;
-
-                min-height: 76px;
-                height: 76px;
-                max-height: 76px;
-
-                border-style: solid;
-                border-color: white;
-                border-width: 2px;
-                border-radius: 40px;
-
-                background-color: black;
-            }
-
-            QPushButton:checked {
-                background-color: white;
-            }
-            """
-        )
-
+        self._geometry: Geometry = geometry
+        self._bits: int = 0
+        self._size: int = 0
+        self._spacing: int = 0
         self._row: int = 0
         self._col: int = 0
-        self._buttons: list[QPushButton] = []
-
-        for r in range(6):
-            for c in range(6):
-                button = QPushButton()
-                button.setCheckable(True)
-                button.clicked.connect(self._fake_focus_handler(r, c))
-                self._buttons.append(button)
-                grid.addWidget(button, r, c)
+        self._stroke: bool | None = None
 
-        grid.setContentsMargins(0, 0, 0, 0)
-        grid.setSpacing(8)
-
-        self.setLayout(grid)
-        self.setFixedSize(self.sizeHint())
-        self._update_focus()
+        self.set_geometry(geometry)
 
         up = QShortcut(QKeySequence(Qt.Key.Key_Up), self)
         up.activated.connect(self._handle_up)
@@ -162,50 +160,143 @@ class _Canvas(QWidget):
 
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
+    def set_geometry(self, geometry: Geometry) -> None:
+        self._geometry = geometry
+        self._bits = 0
+        self._size = max(10, min(80, 600 // max(geometry.width, geometry.height)))
+        self._spacing = max(1, self._size // 10)
+        self._row = 0
+        self._col = 0
+        self._stroke = None
+
+        pitch = self._size + self._spacing
+        self.setFixedSize(
+            2 * _MARGIN + geometry.width * pitch - self._spacing,
+            2 * _MARGIN + geometry.height * pitch - self._spacing,
+        )
+        self.update()
+
     @Slot()
     def handle_fill_black(self) -> None:
-        for button in self._buttons:
-            button.setChecked(False)
+        self._bits = 0
+        self.update()
+        self.on_change.emit()
 
     @Slot()
     def handle_fill_white(self) -> None:
-        for button in self._buttons:
-            button.setChecked(True)
-
-    def dots(self) -> list[Display.Dot]:
-        return [
-            Display.Dot.WHITE if button.isChecked() else Display.Dot.BLACK
-            for button in self._buttons
-        ]
-
-    def _fake_focus_handler(self, row: int, col: int) -> Callable[[], None]:
-        @Slot()
-        def handle() -> None:
-            self._row = row
-            self._col = col
-            self._update_focus()
-
-        return cast(Callable[[], None], handle)
-
-    def _update_focus(self) -> None:
-        for index, button in enumerate(self._buttons):
-            if index == self._row * 6 + self._col:
-                button.setStyleSheet(
-                    """
-                    min-width: 68px;
-                    width: 68px;
-                    max-width: 68px;
-
-                    min-height: 68px;
-                    height: 68px;
-                    max-height: 68px;
-
-                    border-color: gold;
-                    border-width: 6px;
-                    """
-                )
-            else:
-                button.setStyleSheet("")
+        self._bits = (1 << self._geometry.dots()) - 1
+        self.update()
+        self.on_change.emit()
+
+    def frame(self) -> Frame:
+        return Frame(self._geometry, self._bits)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        painter.setPen(QPen(Qt.GlobalColor.white, 2))
+        painter.setBrush(Qt.GlobalColor.black)
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(1, 1, -1, -1), 5, 5)
+
+        pitch = self._size + self._spacing
+        dirty = event.rect()
+
+        first_row = max(0, (dirty.top() - _MARGIN) // pitch)
+        last_row = min(self._geometry.height - 1, (dirty.bottom() - _MARGIN) // pitch)
+        first_col = max(0, (dirty.left() - _MARGIN) // pitch)
+        last_col = min(self._geometry.width - 1, (dirty.right() - _MARGIN) // pitch)
+
+        border = 2 if self._size >= 20 else 1
+        focus = max(2, self._size * 3 // 40)
+        white = QPen(Qt.GlobalColor.white, border)
+        gold = QPen(QColor("gold"), focus)
+
+        for r in range(first_row, last_row + 1):
+            for c in range(first_col, last_col + 1):
+                index = r * self._geometry.width + c
+                rect = QRectF(self._cell_rect(r, c))
+
+                if r == self._row and c == self._col:
+                    painter.setPen(gold)
+                    rect.adjust(focus / 2, focus / 2, -focus / 2, -focus / 2)
+                else:
+                    painter.setPen(white)
+                    rect.adjust(border / 2, border / 2, -border / 2, -border / 2)
+
+                if self._bits >> index & 1:
+                    painter.setBrush(Qt.GlobalColor.white)
+                else:
+                    painter.setBrush(Qt.GlobalColor.black)
+
+                painter.drawEllipse(rect)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() != Qt.MouseButton.LeftButton:
+            super().mousePressEvent(event)
+            return
+
+        cell = self._cell_at(event.position().toPoint())
+
+        if cell is None:
+            return
+
+        row, col = cell
+        self._stroke = not self._bits >> (row * self._geometry.width + col) & 1
+        self._move_focus(row, col)
+        self._set(row, col, self._stroke)
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        if self._stroke is None:
+            return
+
+        cell = self._cell_at(event.position().toPoint())
+
+        if cell is not None and cell != (self._row, self._col):
+            self._move_focus(*cell)
+            self._set(*cell, self._stroke)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._stroke = None
+
+    def _cell_rect(self, row: int, col: int) -> QRect:
+        pitch = self._size + self._spacing
+        return QRect(
+            _MARGIN + col * pitch, _MARGIN + row * pitch, self._size, self._size
+        )
+
+    def _cell_at(self, point: QPoint) -> tuple[int, int] | None:
+        pitch = self._size + self._spacing
+        x = point.x() - _MARGIN
+        y = point.y() - _MARGIN
+
+        if x < 0 or y < 0 or x % pitch >= self._size or y % pitch >= self._size:
+            return None
+
+        row = y // pitch
+        col = x // pitch
+
+        if row >= self._geometry.height or col >= self._geometry.width:
+            return None
+
+        return row, col
+
+    def _set(self, row: int, col: int, on: bool) -> None:
+        bit = 1 << (row * self._geometry.width + col)
+
+        if bool(self._bits & bit) == on:
+            return
+
+        self._bits ^= bit
+        self.update(self._cell_rect(row, col))
+        self.on_change.emit()
+
+    def _move_focus(self, row: int, col: int) -> None:
+        self.update(self._cell_rect(self._row, self._col))
+        self._row = row
+        self._col = col
+        self.update(self._cell_rect(self._row, self._col))
 
     @Slot()
     def _handle_up(self) -> None:
@@ -213,19 +304,15 @@ class _Canvas(QWidget):
             return
 
         if self._row > 0:
-            self._row -= 1
-
-        self._update_focus()
+            self._move_focus(self._row - 1, self._col)
 
     @Slot()
     def _handle_down(self) -> None:
         if not self.hasFocus():
             return
 
-        if self._row < 5:
-            self._row += 1
-
-        self._update_focus()
+        if self._row < self._geometry.height - 1:
+            self._move_focus(self._row + 1, self._col)
 
     @Slot()
     def _handle_left(self) -> None:
@@ -233,27 +320,23 @@ class _Canvas(QWidget):
             return
 
         if self._col > 0:
-            self._col -= 1
-
-        self._update_focus()
+            self._move_focus(self._row, self._col - 1)
 
     @Slot()
     def _handle_right(self) -> None:
         if not self.hasFocus():
             return
 
-        if self._col < 5:
-            self._col += 1
-
-        self._update_focus()
+        if self._col < self._geometry.width - 1:
+            self._move_focus(self._row, self._col + 1)
 
     @Slot()
     def _handle_toggle(self) -> None:
         if not self.hasFocus():
             return
 
-        button = self._buttons[self._row * 6 + self._col]
-        button.setChecked(not button.isChecked())
+        index = self._row * self._geometry.width + self._col
+        self._set(self._row, self._col, not self._bits >> index & 1)
 
     @Slot()
     def _handle_submit(self) -> None:
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import time
+from enum import Enum, auto
+
+
+class PlaybackClock:
+    class Policy(Enum):
+        DROP = auto()
+        SLOW = auto()
+        HYBRID = auto()
+
+        def __str__(self) -> str:
+            match self:
+                case PlaybackClock.Policy.DROP:
+                    return "Drop Frames"
+                case PlaybackClock.Policy.SLOW:
+                    return "Slow Down"
+                case PlaybackClock.Policy.HYBRID:
+                    return "Hybrid"
+
+    def __init__(
+        self, fps: float, policy: Policy = Policy.DROP, max_lag: int = 3
+    ) -> None:
+        assert fps > 0
+
+        self._fps: float = fps
+        self._policy: PlaybackClock.Policy = policy
+        self._max_lag: int = max_lag
+
+        self._origin: int = 0
+        self._paused_at: int | None = 0
+        self._last: int = -1
+
+        self._on_time: int = 0
+        self._late: int = 0
+        self._dropped: int = 0
+
+    def policy(self) -> Policy:
+        return self._policy
+
+    def set_policy(self, policy: Policy) -> None:
+        self._policy = policy
+
+    def start(self, index: int = 0) -> None:
+        self._on_time = 0
+        self._late = 0
+        self._dropped = 0
+        self._paused_at = 0
+        self.seek(index)
+        self.resume()
+
+    def pause(self) -> None:
+        if self._paused_at is None:
+            self._paused_at = self._now()
+
+    def resume(self) -> None:
+        if self._paused_at is not None:
+            self._origin = time.perf_counter_ns() - self._paused_at
+            self._paused_at = None
+
+    def is_paused(self) -> bool:
+        return self._paused_at is not None
+
+    def seek(self, index: int) -> None:
+        position = round(index * 1_000_000_000 / self._fps)
+
+        if self._paused_at is None:
+            self._origin = time.perf_counter_ns() - position
+        else:
+            self._paused_at = position
+
+        self._last = index - 1
+
+    def position(self) -> float:
+        return self._now() / 1_000_000_000
+
+    def next(self) -> int | None:
+        if self._paused_at is not None:
+            return None
+
+        due = int(self._now() * self._fps // 1_000_000_000)
+        expected = self._last + 1
+
+        if due < expected:
+            return None
+
+        match self._policy:
+            case PlaybackClock.Policy.DROP:
+                index = due
+            case PlaybackClock.Policy.SLOW:
+                index = expected
+
+                if index < due:
+                    self._origin += self._now() - round(
+                        index * 1_000_000_000 / self._fps
+                    )
+            case PlaybackClock.Policy.HYBRID:
+                index = due if due - expected > self._max_lag else expected
+
+        self._dropped += index - expected
+
+        if index < due:
+            self._late += 1
+        else:
+            self._on_time += 1
+
+        self._last = index
+        return index
+
+    def on_time(self) -> int:
+        return self._on_time
+
+    def late(self) -> int:
+        return self._late
+
+    def dropped(self) -> int:
+        return self._dropped
+
+    def _now(self) -> int:
+        if self._paused_at is not None:
+            return self._paused_at
+
+        return time.perf_counter_ns() - self._origin
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QObject,
+    QStandardPaths,
+    QThread,
+    QTimer,
+    QUrl,
+    Signal,
+    Slot,
+)
+from PySide6.QtMultimedia import QMediaPlayer, QVideoFrame, QVideoSink
+
+from flipflops.animation import AnimationWriter
+from flipflops.conversion import Converter
+from flipflops.frame import Frame, Geometry
+from flipflops.luma import convert_video_frame
+
+_FPS = 30
+
+_PLAYBACK_RATE = 4.0
+
+
+class PreRenderer(QObject):
+    on_progress: Signal = Signal(int)
+    on_finish: Signal = Signal(str)
+    on_error: Signal = Signal(str)
+
+    _request_render: Signal = Signal(int, str, Geometry, object)
+    _request_cancel: Signal = Signal()
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._job: int = 0
+
+        self._thread: QThread = QThread()
+        self._thread.setObjectName("PreRenderer")
+
+        self._worker: _Worker = _Worker()
+        self._worker.moveToThread(self._thread)
+        self._thread.finished.connect(self._worker.deleteLater)
+
+        self._request_render.connect(self._worker.render)
+        self._request_cancel.connect(self._worker.cancel)
+
+        self._worker.on_progress.connect(self._handle_progress)
+        self._worker.on_finish.connect(self._handle_finish)
+        self._worker.on_error.connect(self._handle_error)
+
+        self._thread.start()
+
+        application = QCoreApplication.instance()
+        assert application is not None
+        application.aboutToQuit.connect(self._handle_quit)
+
+    def render(self, path: str, geometry: Geometry, converter: Converter) -> None:
+        self._job += 1
+        self._request_render.emit(self._job, path, geometry, converter.copy())
+
+    def cancel(self) -> None:
+        self._job += 1
+        self._request_cancel.emit()
+
+    @Slot(int, int)
+    def _handle_progress(self, job: int, percent: int) -> None:
+        if job == self._job:
+            self.on_progress.emit(percent)
+
+    @Slot(int, str)
+    def _handle_finish(self, job: int, path: str) -> None:
+        if job == self._job:
+            self.on_finish.emit(path)
+
+    @Slot(int, str)
+    def _handle_error(self, job: int, message: str) -> None:
+        if job == self._job:
+            self.on_error.emit(message)
+
+    @Slot()
+    def _handle_quit(self) -> None:
+        self._thread.quit()
+        self._thread.wait()
+
+
+class _Worker(QObject):
+    on_progress: Signal = Signal(int, int)
+    on_finish: Signal = Signal(int, str)
+    on_error: Signal = Signal(int, str)
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._media: QMediaPlayer | None = None
+        self._sink: QVideoSink | None = None
+
+        self._pending: tuple[int, str, Geometry, Converter] | None = None
+        self._digests: dict[tuple[str, int, int], str] = {}
+
+        self._job: int = 0
+        self._path: str = ""
+        self._writer: AnimationWriter | None = None
+        self._geometry: Geometry = Geometry(6, 6)
+        self._converter: Converter = Converter()
+        self._last: Frame = Frame(self._geometry)
+        self._written: int = 0
+        self._percent: int = 0
+
+    @Slot(int, str, Geometry, object)
+    def render(
+        self, job: int, source: str, geometry: Geometry, converter: Converter
+    ) -> None:
+        if self._pending is None:
+            QTimer.singleShot(0, self._start)
+
+        self.cancel()
+        self._pending = (job, source, geometry, converter)
+
+    @Slot()
+    def _start(self) -> None:
+        if self._pending is None:
+            return
+
+        job, source, geometry, converter = self._pending
+        self._pending = None
+        self._job = job
+
+        try:
+            key = f"{geometry.width}x{geometry.height}-{converter.key()}.flip"
+            path = os.path.join(_cache_directory(), f"{self._digest(source)}-{key}")
+
+            if os.path.exists(path):
+                self.on_progress.emit(job, 100)
+                self.on_finish.emit(job, path)
+                return
+
+            self._writer = AnimationWriter(f"{path}.part", geometry, _FPS)
+        except OSError as error:
+            self.on_error.emit(job, f"{error}")
+            return
+
+        self._path = path
+        self._geometry = geometry
+        self._converter = converter
+        self._last = Frame(geometry)
+        self._written = 0
+        self._percent = 0
+
+        if self._media is None:
+            self._sink = QVideoSink(self)
+            self._sink.videoFrameChanged.connect(self._handle_frame)
+
+            self._media = QMediaPlayer(self)
+            self._media.setVideoSink(self._sink)
+            self._media.mediaStatusChanged.connect(self._handle_status)
+            self._media.errorOccurred.connect(self._handle_error)
+
+        self._media.setSource(QUrl.fromLocalFile(source))
+        self._media.setPlaybackRate(_PLAYBACK_RATE)
+        self._media.play()
+
+    @Slot()
+    def cancel(self) -> None:
+        self._pending = None
+
+        if self._writer is None:
+            return
+
+        assert self._media is not None
+
+        writer = self._writer
+        self._writer = None
+        self._media.stop()
+        writer.close()
+
+        try:
+            os.remove(f"{self._path}.part")
+        except OSError:
+            pass
+
+    @Slot(QVideoFrame)
+    def _handle_frame(self, frame: QVideoFrame) -> None:
+        if self._writer is None or not frame.isValid():
+            return
+
+        assert self._media is not None
+
+        time = frame.startTime()
+
+        if time < 0:
+            time = self._media.position() * 1000
+
+        self._fill(time * _FPS // 1_000_000)
+        self._last = convert_video_frame(frame, self._geometry, self._converter)
+
+    @Slot(QMediaPlayer.MediaStatus)
+    def _handle_status(self, status: QMediaPlayer.MediaStatus) -> None:
+        if self._writer is None or status != QMediaPlayer.MediaStatus.EndOfMedia:
+            return
+
+        assert self._media is not None
+
+        count = math.ceil(self._media.duration() * _FPS / 1000)
+        self._fill(max(count, self._written + 1))
+
+        writer = self._writer
+        self._writer = None
+        writer.close()
+
+        try:
+            os.replace(f"{self._path}.part", self._path)
+        except OSError as error:
+            self.on_error.emit(self._job, f"{error}")
+            return
+
+        self.on_progress.emit(self._job, 100)
+        self.on_finish.emit(self._job, self._path)
+
+    @Slot(QMediaPlayer.Error, str)
+    def _handle_error(self, error: QMediaPlayer.Error, message: str) -> None:
+        if self._writer is None:
+            return
+
+        self.cancel()
+        self.on_error.emit(self._job, f"{error.name}: {message}.")
+
+    def _digest(self, path: str) -> str:
+        status = os.stat(path)
+        key = (path, status.st_size, status.st_mtime_ns)
+
+        if key not in self._digests:
+            with open(path, "rb") as file:
+                self._digests[key] = hashlib.file_digest(file, "sha256").hexdigest()
+
+        return self._digests[key]
+
+    def _fill(self, count: int) -> None:
+        assert self._writer is not None
+        assert self._media is not None
+
+        while self._written < count:
+            self._writer.write(self._last)
+            self._written += 1
+
+        duration = self._media.duration()
+
+        if duration > 0:
+            percent = min(99, self._written * 100_000 // (duration * _FPS))
+
+            if percent != self._percent:
+                self._percent = percent
+                self.on_progress.emit(self._job, percent)
+
+
+def _cache_directory() -> str:
+    directory = os.path.join(
+        QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation),
+        "renders",
+    )
+
+    os.makedirs(directory, exist_ok=True)
+    return directory
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-import random
-
 from PySide6.QtCore import Qt, Slot
-from PySide6.QtWidgets import QHBoxLayout, QPushButton, QSpinBox, QVBoxLayout, QWidget
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QPushButton,
+    QSpinBox,
+    QVBoxLayout,
+    QWidget,
+)
 
 from flipflops.display import Display
+from flipflops.frame import Geometry
+from flipflops.generators import Generator, Lookahead, RandomDots
 
 
 class Randomize(QWidget):
@@ -15,13 +22,12 @@ class Randomize(QWidget):
         self._index: int = index
 
         self._display: Display = display
-        self._display.on_ready.connect(self._handle_ready)
-        self._display.on_done.connect(self._handle_ready)
+        self._display.on_writable.connect(self._handle_writable)
         self._display.on_close.connect(self._handle_close)
+        self._display.on_geometry_change.connect(self._handle_geometry_change)
 
         self._playing: bool = False
-        self._ready: bool = False
-        self._dots: list[Display.Dot] = [Display.Dot.BLACK] * 36
+        self._lookahead: Lookahead | None = None
 
         vbox = QVBoxLayout()
         vbox.setSpacing(5)
@@ -30,10 +36,21 @@ class Randomize(QWidget):
 
         vbox.addStretch(1)
 
+        self._generator_select: QComboBox = QComboBox()
+
+        for kind in Generator.Kind:
+            self._generator_select.addItem(str(kind), kind)
+
+        self._generator_select.currentIndexChanged.connect(
+            self._handle_generator_select
+        )
+        vbox.addWidget(self._generator_select)
+
         self._changes: QSpinBox = QSpinBox(
-            minimum=1, maximum=36, value=36, suffix=" changes"
+            minimum=1, maximum=9999, value=9999, suffix=" changes"
         )
         self._changes.setFixedWidth(self._changes.sizeHint().width())
+        self._changes.setMaximum(self._display.geometry().dots())
         self._changes.valueChanged.connect(self._handle_value_change)
         self._changes.setValue(1)
         vbox.addWidget(self._changes)
@@ -61,6 +78,12 @@ class Randomize(QWidget):
             self._playing = False
             self._start_stop.setText("Start")
 
+    @Slot(Geometry)
+    def _handle_geometry_change(self, geometry: Geometry) -> None:
+        self._playing = False
+        self._start_stop.setText("Start")
+        self._changes.setMaximum(geometry.dots())
+
     @Slot(int)
     def _handle_value_change(self, value: int) -> None:
         if value == 1:
@@ -68,22 +91,27 @@ class Randomize(QWidget):
         else:
             self._changes.setSuffix(" changes")
 
-    @Slot()
-    def _handle_ready(self) -> None:
-        self._start_stop.setEnabled(True)
+        if self._lookahead is not None:
+            generator = self._lookahead.generator()
 
-        if not self._playing:
-            self._ready = True
-            return
+            if isinstance(generator, RandomDots):
+                generator.set_changes(value)
 
-        for index in random.sample(range(36), self._changes.value()):
-            self._dots[index] = (
-                Display.Dot.WHITE
-                if self._dots[index] == Display.Dot.BLACK
-                else Display.Dot.BLACK
-            )
+    @Slot(int)
+    def _handle_generator_select(self, index: int) -> None:
+        kind = self._generator_select.itemData(index)
+        self._changes.setEnabled(kind == Generator.Kind.RANDOM)
 
-        self._display.write_display(self._dots)
+        if self._playing:
+            self._start()
+
+    @Slot()
+    def _handle_writable(self) -> None:
+        self._start_stop.setEnabled(True)
+
+        while self._playing and self._display.can_write():
+            assert self._lookahead is not None
+            self._display.write_frame(self._lookahead.take())
 
     @Slot()
     def _handle_close(self) -> None:
@@ -98,9 +126,16 @@ class Randomize(QWidget):
             self._start_stop.setText("Start")
         else:
             self._playing = True
-            self._dots = [Display.Dot.BLACK] * 36
             self._start_stop.setText("Stop")
+            self._start()
+
+    def _start(self) -> None:
+        generator = Generator.create(
+            self._generator_select.currentData(), self._display.geometry()
+        )
+
+        if isinstance(generator, RandomDots):
+            generator.set_changes(self._changes.value())
 
-            if self._ready:
-                self._ready = False
-                self._handle_ready()
+        self._lookahead = Lookahead(generator)
+        self._handle_writable()
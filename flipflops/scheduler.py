@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from flipflops.frame import Frame, Geometry
+
+_DEFAULT_FLIP_TIME = 0.002
+
+
+class Pulse(NamedTuple):
+    rows: int
+    white: int
+    black: int
+
+
+class Timings(NamedTuple):
+    rows: tuple[float, ...]
+    dot: float
+
+    @staticmethod
+    def default(geometry: Geometry) -> Timings:
+        return Timings((_DEFAULT_FLIP_TIME,) * geometry.height, _DEFAULT_FLIP_TIME)
+
+
+class Scheduler:
+    def __init__(self, geometry: Geometry) -> None:
+        self._geometry: Geometry = geometry
+        self._timings: Timings = Timings.default(geometry)
+        self._max_coils: int | None = None
+        self._baud_rate: int = 9600
+
+    def set_geometry(self, geometry: Geometry) -> None:
+        self._geometry = geometry
+        self._timings = Timings.default(geometry)
+
+    def timings(self) -> Timings:
+        return self._timings
+
+    def set_timings(self, timings: Timings) -> None:
+        assert len(timings.rows) == self._geometry.height
+        self._timings = timings
+
+    def set_max_coils(self, max_coils: int | None) -> None:
+        assert max_coils is None or max_coils >= 1
+        self._max_coils = max_coils
+
+    def set_baud_rate(self, baud_rate: int) -> None:
+        self._baud_rate = baud_rate
+
+    # NOTE: Greedy weighted set cover over row sets, None once over budget.
+    def schedule(
+        self, current: Frame, target: Frame, budget: float | None = None
+    ) -> list[Pulse] | None:
+        assert current.geometry() == target.geometry() == self._geometry
+
+        if budget is not None and self._lower_bound(current, target) >= budget:
+            return None
+
+        need, allow = self._columns(current, target)
+        pulses = []
+        elapsed = 0.0
+
+        while len(need) > 0:
+            candidates = set(need.values())
+
+            if len(candidates) <= 16:
+                candidates |= {
+                    a | b
+                    for a in candidates
+                    for b in candidates
+                    if a != b and any((a | b) & ~mask == 0 for mask in allow.values())
+                }
+
+            if self._max_coils is not None:
+                candidates = {
+                    chunk for rows in candidates for chunk in self._split(rows)
+                }
+
+            best: tuple[float, int, list[tuple[int, bool]]] | None = None
+
+            for rows in candidates:
+                columns = None
+
+                if self._max_coils is not None:
+                    columns = self._max_coils // rows.bit_count()
+
+                gains = sorted(
+                    (
+                        ((rows & mask).bit_count(), key)
+                        for key, mask in need.items()
+                        if rows & mask != 0 and rows & ~allow[key] == 0
+                    ),
+                    reverse=True,
+                )[:columns]
+
+                if len(gains) == 0:
+                    continue
+
+                score = sum(gain for gain, _ in gains) / self._pulse_time(rows)
+
+                if best is None or score > best[0]:
+                    best = (score, rows, [key for _, key in gains])
+
+            assert best is not None
+
+            _, rows, keys = best
+            elapsed += self._pulse_time(rows)
+
+            if budget is not None and elapsed >= budget:
+                return None
+
+            white = 0
+            black = 0
+
+            for c, colour in keys:
+                if colour:
+                    white |= 1 << c
+                else:
+                    black |= 1 << c
+
+                need[c, colour] &= ~rows
+
+                if need[c, colour] == 0:
+                    del need[c, colour]
+
+            pulses.append(Pulse(rows, white, black))
+
+        return pulses
+
+    def _split(self, rows: int) -> list[int]:
+        assert self._max_coils is not None
+
+        chunks = []
+
+        while rows != 0:
+            chunk = 0
+
+            for _ in range(self._max_coils):
+                if rows == 0:
+                    break
+
+                bit = rows & -rows
+                rows ^= bit
+                chunk |= bit
+
+            chunks.append(chunk)
+
+        return chunks
+
+    def _lower_bound(self, current: Frame, target: Frame) -> float:
+        changed = current ^ target
+        rows = [r for r in range(self._geometry.height) if changed.row(r) != 0]
+        pulses = 1
+
+        if self._max_coils is not None:
+            pulses = -(-changed.count() // self._max_coils)
+
+        return pulses * self._pulse_time(0) + sum(self._timings.rows[r] for r in rows)
+
+    def display_time(self, length: int, changed: int) -> float:
+        return self._wire_time(length) + changed * self._timings.dot
+
+    def _pulse_time(self, rows: int) -> float:
+        length = len(b"raw: ") + self._geometry.height + self._geometry.width
+        flip = sum(
+            time for r, time in enumerate(self._timings.rows) if rows >> r & 1 == 1
+        )
+
+        return self._wire_time(length) + flip
+
+    def _wire_time(self, length: int) -> float:
+        return (length + 1) * 10 / self._baud_rate
+
+    def _columns(
+        self, current: Frame, target: Frame
+    ) -> tuple[dict[tuple[int, bool], int], dict[tuple[int, bool], int]]:
+        width = self._geometry.width
+        changed = current.bits() ^ target.bits()
+        need: dict[tuple[int, bool], int] = {}
+
+        while changed != 0:
+            bit = changed & -changed
+            changed ^= bit
+
+            r, c = divmod(bit.bit_length() - 1, width)
+            key = (c, target.bits() & bit != 0)
+            need[key] = need.get(key, 0) | 1 << r
+
+        allow: dict[tuple[int, bool], int] = {key: 0 for key in need}
+
+        for r in range(self._geometry.height):
+            row = target.row(r)
+
+            for c, colour in allow:
+                if (row >> c & 1 == 1) == colour:
+                    allow[c, colour] |= 1 << r
+
+        return need, allow
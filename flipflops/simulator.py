@@ -0,0 +1,347 @@
+# TODO: Support Windows, which has no pseudo-terminals to hand to QSerialPort.
+
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import signal
+import sys
+import tempfile
+import time
+from collections import deque
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QObject,
+    QSocketNotifier,
+    QTimer,
+    Signal,
+    Slot,
+)
+
+from flipflops.frame import Frame, Geometry
+
+if sys.platform != "win32":
+    import termios
+    import tty
+
+_BASE_BAUD_RATE = 9600
+_LINK_PREFIX = "flipflops-simulator-"
+
+
+def running_simulators() -> list[str]:
+    links = glob.glob(os.path.join(tempfile.gettempdir(), _LINK_PREFIX + "*"))
+    running = []
+
+    for link in sorted(links):
+        pid = os.path.basename(link).removeprefix(_LINK_PREFIX).partition("-")[0]
+
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            try:
+                os.unlink(link)
+            except OSError:
+                pass
+
+            continue
+        except (ValueError, PermissionError):
+            pass
+
+        if os.path.exists(link):
+            running.append(link)
+
+    return running
+
+
+class Simulator(QObject):
+    on_change: Signal = Signal(Frame)
+    on_command: Signal = Signal(bytes)
+
+    def __init__(
+        self,
+        geometry: Geometry,
+        flip_time: float = 0.002,
+        queue: int = 2,
+        max_baud_rate: int = 1000000,
+        legacy: bool = False,
+    ) -> None:
+        super().__init__()
+
+        self._geometry: Geometry = geometry
+        self._flip_time: float = flip_time
+        self._queue: int = queue
+        self._max_baud_rate: int = max_baud_rate
+        self._legacy: bool = legacy
+
+        self._master: int = -1
+        self._slave: int = -1
+        self._link: str = ""
+        self._notifier: QSocketNotifier | None = None
+        self._attributes: list[int | list[bytes | int]] = []
+
+        self._buffer: bytes = b""
+        self._commands: deque[bytes] = deque()
+        self._frame: Frame = Frame(geometry)
+        self._force: bool = False
+        self._busy: bool = False
+        self._completed: int = 0
+        self._baud_rate: int = _BASE_BAUD_RATE
+        self._echo_pending: bool = False
+        self._ignore_until: float = 0
+
+        # NOTE: Opening a serial port resets the real board, which the pty
+        #       cannot signal directly. Instead the slave's line speed is set to
+        #       an unused value and polled, a host opening the port changes it.
+        self._poll_timer: QTimer = QTimer(interval=50)
+        self._poll_timer.timeout.connect(self._handle_poll)
+
+        self._revert_timer: QTimer = QTimer(singleShot=True, interval=1000)
+        self._revert_timer.timeout.connect(self._handle_revert)
+
+    def frame(self) -> Frame:
+        return self._frame
+
+    def start(self) -> str:
+        assert self._master == -1
+
+        if sys.platform == "win32":
+            raise RuntimeError("Simulating is only supported on POSIX systems.")
+
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        self._arm()
+
+        path = os.ttyname(self._slave)
+        self._link = os.path.join(
+            tempfile.gettempdir(), f"{_LINK_PREFIX}{os.getpid()}-{id(self)}"
+        )
+        os.symlink(path, self._link)
+
+        self._notifier = QSocketNotifier(self._master, QSocketNotifier.Type.Read)
+        self._notifier.activated.connect(self._handle_read)
+        self._poll_timer.start()
+
+        return self._link
+
+    def stop(self) -> None:
+        assert self._notifier is not None
+
+        self._poll_timer.stop()
+        self._revert_timer.stop()
+        self._notifier.setEnabled(False)
+        self._notifier = None
+
+        if os.path.islink(self._link):
+            os.unlink(self._link)
+
+        os.close(self._master)
+        os.close(self._slave)
+
+        self._master = -1
+        self._slave = -1
+
+    def _arm(self) -> None:
+        assert sys.platform != "win32"
+
+        attributes = termios.tcgetattr(self._slave)
+        attributes[4] = attributes[5] = termios.B50
+        termios.tcsetattr(self._slave, termios.TCSANOW, attributes)
+        self._attributes = attributes
+
+    @Slot()
+    def _handle_poll(self) -> None:
+        assert sys.platform != "win32"
+
+        if termios.tcgetattr(self._slave) == self._attributes:
+            return
+
+        if time.monotonic() < self._ignore_until:
+            self._arm()
+            return
+
+        self._arm()
+        self._ignore_until = time.monotonic() + 0.5
+        self._buffer = b""
+        self._commands.clear()
+        self._force = False
+        self._completed = 0
+        self._baud_rate = _BASE_BAUD_RATE
+        QTimer.singleShot(100, lambda: self._reply(b"ready"))
+
+    @Slot()
+    def _handle_read(self) -> None:
+        try:
+            self._buffer += os.read(self._master, 4096)
+        except OSError:
+            return
+
+        while True:
+            if self._buffer.startswith(b"#"):
+                length = 1 + (self._geometry.dots() + 7) // 8
+
+                if len(self._buffer) < length + 1:
+                    break
+
+                command = self._buffer[:length]
+                self._buffer = self._buffer[length + 1 :]
+            else:
+                index = self._buffer.find(b"\n")
+
+                if index == -1:
+                    break
+
+                command = self._buffer[:index]
+                self._buffer = self._buffer[index + 1 :]
+
+            self.on_command.emit(command)
+
+            if command == b"abort":
+                self._commands.clear()
+            else:
+                self._commands.append(command)
+
+        self._process()
+
+    def _process(self) -> None:
+        if self._busy or len(self._commands) == 0:
+            return
+
+        command = self._commands.popleft()
+        target = self._target(command)
+        seconds = (len(command) + 1) * 10 / self._baud_rate
+
+        if target is not None:
+            if command.startswith(b"raw: "):
+                rows = command[5 : 5 + self._geometry.height]
+                seconds += rows.count(b"1") * self._flip_time
+            elif self._force:
+                seconds += self._geometry.dots() * self._flip_time
+            else:
+                changed = (self._frame ^ target).count()
+                seconds += changed * self._flip_time
+
+        self._busy = True
+        QTimer.singleShot(round(seconds * 1000), lambda: self._finish(command, target))
+
+    def _finish(self, command: bytes, target: Frame | None) -> None:
+        self._busy = False
+
+        if self._master == -1:
+            return
+
+        if target is not None:
+            self._frame = target
+            self.on_change.emit(target)
+            self._reply(b"done" if self._legacy else b"done %d" % self._completed)
+            self._completed = (self._completed + 1) % 256
+        elif command == b"caps" and not self._legacy:
+            self._reply(
+                b"caps: packed baud queue=%d size=%dx%d"
+                % (self._queue, self._geometry.width, self._geometry.height)
+            )
+        elif command.startswith(b"baud: ") and not self._legacy:
+            self._reply(b"baud: ok")
+            self._ignore_until = time.monotonic() + 1.5
+            self._baud_rate = int(command.removeprefix(b"baud: "))
+            self._echo_pending = True
+            self._revert_timer.start()
+        elif command.startswith(b"echo: ") and self._echo_pending:
+            self._ignore_until = time.monotonic() + 1.5
+
+            if self._baud_rate <= self._max_baud_rate:
+                self._echo_pending = False
+                self._revert_timer.stop()
+                self._reply(command)
+        elif command == b"force: on":
+            self._force = True
+        elif command == b"force: off":
+            self._force = False
+
+        self._process()
+
+    def _target(self, command: bytes) -> Frame | None:
+        if command.startswith(b"#"):
+            return Frame(self._geometry, int.from_bytes(command[1:], "little"))
+
+        if command.startswith(b"display: "):
+            return Frame.from_ascii(self._geometry, command.removeprefix(b"display: "))
+
+        if command.startswith(b"raw: "):
+            rows = command[5 : 5 + self._geometry.height]
+            cols = command[5 + self._geometry.height :]
+            white = sum(1 << c for c, col in enumerate(cols) if col == ord("1"))
+            black = sum(1 << c for c, col in enumerate(cols) if col == ord("0"))
+            bits = self._frame.bits()
+
+            for r, row in enumerate(rows):
+                if row == ord("1"):
+                    shift = r * self._geometry.width
+                    bits = (bits | white << shift) & ~(black << shift)
+
+            return Frame(self._geometry, bits)
+
+        return None
+
+    @Slot()
+    def _handle_revert(self) -> None:
+        self._echo_pending = False
+        self._baud_rate = _BASE_BAUD_RATE
+
+    def _reply(self, line: bytes) -> None:
+        if self._master != -1:
+            os.write(self._master, line + b"\n")
+
+
+def _render(frame: Frame) -> None:
+    geometry = frame.geometry()
+    rows = (
+        "".join("●" if frame.dot(r, c) else "·" for c in range(geometry.width))
+        for r in range(geometry.height)
+    )
+    sys.stdout.write("\x1b[H\x1b[2J" + "\n".join(rows) + "\n")
+    sys.stdout.flush()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Simulate a Flippy board on a pseudo-terminal."
+    )
+    parser.add_argument("--width", type=int, default=6)
+    parser.add_argument("--height", type=int, default=6)
+    parser.add_argument(
+        "--flip-time", type=float, default=0.002, help="seconds per dot"
+    )
+    parser.add_argument("--queue", type=int, default=2)
+    parser.add_argument("--max-baud-rate", type=int, default=1000000)
+    parser.add_argument("--legacy", action="store_true", help="only speak ASCII")
+    parser.add_argument("--quiet", action="store_true", help="do not render frames")
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    signal.signal(signal.SIGTERM, lambda *_: app.quit())
+
+    simulator = Simulator(
+        Geometry(args.width, args.height),
+        flip_time=args.flip_time,
+        queue=args.queue,
+        max_baud_rate=args.max_baud_rate,
+        legacy=args.legacy,
+    )
+
+    if not args.quiet:
+        simulator.on_change.connect(_render)
+
+    path = simulator.start()
+    print(f"Simulating on {path}", file=sys.stderr)
+
+    try:
+        app.exec()
+    finally:
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
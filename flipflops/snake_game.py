@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import random
+from collections import deque
 from collections.abc import Callable
 from enum import Enum, auto
 from typing import cast
@@ -17,12 +18,7 @@ from PySide6.QtWidgets import (
 )
 
 from flipflops.display import Display
-
-
-class _Cell(Enum):
-    EMPTY = auto()
-    SNAKE = auto()
-    APPLE = auto()
+from flipflops.frame import Frame, Geometry
 
 
 class _Direction(Enum):
@@ -40,14 +36,16 @@ class SnakeGame(QWidget):
 
         self._starting: bool = False
         self._display: Display = display
-        self._display.on_ready.connect(self._handle_ready)
-        self._display.on_done.connect(self._handle_ready)
+        self._display.on_writable.connect(self._handle_writable)
         self._display.on_close.connect(self._handle_close)
+        self._display.on_geometry_change.connect(self._handle_geometry_change)
 
-        self._cells: list[_Cell] = [_Cell.EMPTY] * 36
+        self._geometry: Geometry = self._display.geometry()
+        self._occupied: int = 0
+        self._apple: int = 0
         self._direction: _Direction = _Direction.RIGHT
 
-        self._snake: list[int] = []
+        self._snake: deque[int] = deque()
         self._eaten: int = 0
 
         self._timer: QTimer = QTimer(interval=600, timerType=Qt.TimerType.PreciseTimer)
@@ -108,7 +106,7 @@ class SnakeGame(QWidget):
             if not self.hasFocus() or not self._timer.isActive():
                 return
 
-            row, col = divmod(self._snake[-1], 6)
+            row, col = divmod(self._snake[-1], self._geometry.width)
 
             match direction:
                 case _Direction.UP:
@@ -120,11 +118,16 @@ class SnakeGame(QWidget):
                 case _Direction.RIGHT:
                     col += 1
 
-            if row < 0 or row > 5 or col < 0 or col > 5:
+            if (
+                row < 0
+                or row >= self._geometry.height
+                or col < 0
+                or col >= self._geometry.width
+            ):
                 self._direction = direction
                 return
 
-            if row * 6 + col == self._snake[-2]:
+            if row * self._geometry.width + col == self._snake[-2]:
                 return
 
             self._direction = direction
@@ -132,7 +135,7 @@ class SnakeGame(QWidget):
         return cast(Callable[[], None], handle)
 
     @Slot()
-    def _handle_ready(self) -> None:
+    def _handle_writable(self) -> None:
         if self._starting:
             self._starting = False
             self._timer.start()
@@ -146,6 +149,12 @@ class SnakeGame(QWidget):
         self._start_stop.setText("Start")
         self._start_stop.setEnabled(False)
 
+    @Slot(Geometry)
+    def _handle_geometry_change(self, geometry: Geometry) -> None:
+        self._timer.stop()
+        self._starting = False
+        self._start_stop.setText("Start")
+
     @Slot()
     def _handle_start(self) -> None:
         if self.hasFocus():
@@ -167,15 +176,21 @@ class SnakeGame(QWidget):
                 f"You Stopped the Game :|\nApples Eaten: {self._eaten}",
             )
         else:
-            self._cells = [_Cell.EMPTY] * 36
-            self._snake = [2 * 6 + 2, 2 * 6 + 3]
+            self._geometry = self._display.geometry()
+
+            row = self._geometry.height // 2 - 1
+            col = self._geometry.width // 2 - 1
+            self._snake = deque(
+                [row * self._geometry.width + col, row * self._geometry.width + col + 1]
+            )
+            self._occupied = 0
 
             for cell in self._snake:
-                self._cells[cell] = _Cell.SNAKE
+                self._occupied |= 1 << cell
 
-            empty_cells = [i for i, c in enumerate(self._cells) if c == _Cell.EMPTY]
-            apple_index = random.choice(empty_cells)
-            self._cells[apple_index] = _Cell.APPLE
+            apple = self._place_apple()
+            assert apple is not None
+            self._apple = apple
 
             self._direction = _Direction.RIGHT
             self._eaten = 0
@@ -183,19 +198,14 @@ class SnakeGame(QWidget):
             self._apples_eaten.setText("Apples Eaten: 0")
             self._start_stop.setText("Stop")
 
-            dots = [
-                Display.Dot.BLACK if cell == _Cell.EMPTY else Display.Dot.WHITE
-                for cell in self._cells
-            ]
-
-            self._display.write_display(dots)
+            self._display.submit(self._frame())
             self.setFocus()
 
             self._starting = True
 
     @Slot()
     def _handle_move_snake(self) -> None:
-        row, col = divmod(self._snake[-1], 6)
+        row, col = divmod(self._snake[-1], self._geometry.width)
 
         match self._direction:
             case _Direction.UP:
@@ -207,7 +217,12 @@ class SnakeGame(QWidget):
             case _Direction.RIGHT:
                 col += 1
 
-        if row < 0 or row > 5 or col < 0 or col > 5:
+        if (
+            row < 0
+            or row >= self._geometry.height
+            or col < 0
+            or col >= self._geometry.width
+        ):
             self._start_stop.setText("Start")
             self._timer.stop()
 
@@ -219,49 +234,75 @@ class SnakeGame(QWidget):
 
             return
 
-        cell_index = row * 6 + col
+        cell = row * self._geometry.width + col
+        tail = self._snake[0]
+
+        if cell == self._apple:
+            self._snake.append(cell)
+            self._occupied |= 1 << cell
 
-        match self._cells[cell_index]:
-            case _Cell.EMPTY:
-                self._cells[cell_index] = _Cell.SNAKE
-                self._snake.append(cell_index)
-                self._cells[self._snake.pop(0)] = _Cell.EMPTY
-            case _Cell.SNAKE:
+            apple = self._place_apple()
+
+            if apple is None:
                 self._start_stop.setText("Start")
                 self._timer.stop()
 
                 QMessageBox.information(
                     self,
                     "Snake Game",
-                    f"You Rammed Into Yourself :(\nApples Eaten: {self._eaten}",
+                    f"YOU WON :)\nApples Eaten: {self._eaten}",
                 )
-            case _Cell.APPLE:
-                self._cells[cell_index] = _Cell.SNAKE
-                self._snake.append(cell_index)
 
-                empty_cells = [i for i, c in enumerate(self._cells) if c == _Cell.EMPTY]
+                return
+
+            self._apple = apple
+            self._eaten += 1
+            self._apples_eaten.setText(f"Apples Eaten: {self._eaten}")
+        elif self._occupied >> cell & 1:
+            self._start_stop.setText("Start")
+            self._timer.stop()
+
+            QMessageBox.information(
+                self,
+                "Snake Game",
+                f"You Rammed Into Yourself :(\nApples Eaten: {self._eaten}",
+            )
+        else:
+            self._snake.append(cell)
+            self._snake.popleft()
+            self._occupied ^= 1 << cell | 1 << tail
+
+        self._display.submit(self._frame())
+
+    def _frame(self) -> Frame:
+        return Frame(self._geometry, self._occupied | 1 << self._apple)
+
+    def _place_apple(self) -> int | None:
+        dots = self._geometry.dots()
+        free = ((1 << dots) - 1) & ~self._occupied
+
+        if free == 0:
+            return None
 
-                if len(empty_cells) == 0:
-                    self._start_stop.setText("Start")
-                    self._timer.stop()
+        for _ in range(8):
+            cell = random.randrange(dots)
 
-                    QMessageBox.information(
-                        self,
-                        "Snake Game",
-                        f"YOU WON :)\nApples Eaten: {self._eaten}",
-                    )
+            if free >> cell & 1:
+                return cell
 
-                    return
+        skip = random.randrange(free.bit_count())
+        base = 0
 
-                apple_index = random.choice(empty_cells)
-                self._cells[apple_index] = _Cell.APPLE
+        while (free & 0xFFFFFFFFFFFFFFFF).bit_count() <= skip:
+            skip -= (free & 0xFFFFFFFFFFFFFFFF).bit_count()
+            free >>= 64
+            base += 64
 
-                self._eaten += 1
-                self._apples_eaten.setText(f"Apples Eaten: {self._eaten}")
+        while True:
+            bit = free & -free
 
-        dots = [
-            Display.Dot.BLACK if cell == _Cell.EMPTY else Display.Dot.WHITE
-            for cell in self._cells
-        ]
+            if skip == 0:
+                return base + bit.bit_length() - 1
 
-        self._display.write_display(dots)
+            free ^= bit
+            skip -= 1
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import csv
+import json
+import time
+from collections import deque
+from typing import NamedTuple
+
+_FIELDS = ["kind", "length", "ends_frame", "write", "wire", "done", "latency"]
+
+
+class Statistics(NamedTuple):
+    fps: float
+    p50: float
+    p95: float
+    p99: float
+    bytes_per_second: float
+    utilization: float
+    samples: int
+
+
+class _Record:
+    __slots__ = ("kind", "length", "ends_frame", "write", "wire", "done")
+
+    def __init__(self, kind: str, length: int, write: float) -> None:
+        self.kind: str = kind
+        self.length: int = length
+        self.ends_frame: bool = False
+        self.write: float = write
+        self.wire: float | None = None
+        self.done: float | None = None
+
+    def latency(self) -> float | None:
+        return None if self.done is None else self.done - self.write
+
+    def row(self) -> dict[str, str | int | float | bool | None]:
+        return {
+            "kind": self.kind,
+            "length": self.length,
+            "ends_frame": self.ends_frame,
+            "write": self.write,
+            "wire": self.wire,
+            "done": self.done,
+            "latency": self.latency(),
+        }
+
+
+class Telemetry:
+    def __init__(self, window: float = 2, history: int = 10000) -> None:
+        self._window: float = window
+        self._start: float = time.perf_counter()
+        self._baud_rate: int = 0
+
+        self._records: deque[_Record] = deque(maxlen=history)
+        self._unwired: deque[tuple[int, _Record]] = deque()
+        self._pending: deque[_Record] = deque()
+        self._queued: int = 0
+        self._written: int = 0
+
+        self._frames: deque[float] = deque()
+        self._latencies: deque[tuple[float, float]] = deque()
+        self._bytes: deque[tuple[float, int]] = deque()
+
+    def reset(self, baud_rate: int) -> None:
+        self._start = time.perf_counter()
+        self._baud_rate = baud_rate
+        self._records.clear()
+        self._unwired.clear()
+        self._pending.clear()
+        self._queued = 0
+        self._written = 0
+        self._frames.clear()
+        self._latencies.clear()
+        self._bytes.clear()
+
+    def set_baud_rate(self, baud_rate: int) -> None:
+        self._baud_rate = baud_rate
+
+    def record_write(self, value: bytes) -> None:
+        kind = "#" if value.startswith(b"#") else value.split(b" ")[0].decode("ascii")
+        record = _Record(kind, len(value) + 1, self._now())
+
+        self._records.append(record)
+        self._unwired.append((self._queued, record))
+        self._queued += record.length
+
+    def track(self, ends_frame: bool) -> None:
+        record = self._records[-1]
+        record.ends_frame = ends_frame
+        self._pending.append(record)
+
+    def record_wire(self, count: int) -> None:
+        now = self._now()
+
+        self._written += count
+        self._bytes.append((now, count))
+
+        while len(self._unwired) > 0 and self._unwired[0][0] < self._written:
+            _, record = self._unwired.popleft()
+            record.wire = now
+
+    def record_done(self) -> None:
+        if len(self._pending) == 0:
+            return
+
+        now = self._now()
+        record = self._pending.popleft()
+        record.done = now
+        self._latencies.append((now, now - record.write))
+
+        if record.ends_frame:
+            self._frames.append(now)
+
+    def abort(self) -> None:
+        self._pending.clear()
+
+    def statistics(self) -> Statistics:
+        now = self._now()
+        cutoff = now - self._window
+
+        while len(self._frames) > 0 and self._frames[0] < cutoff:
+            self._frames.popleft()
+
+        while len(self._latencies) > 0 and self._latencies[0][0] < cutoff:
+            self._latencies.popleft()
+
+        while len(self._bytes) > 0 and self._bytes[0][0] < cutoff:
+            self._bytes.popleft()
+
+        window = min(self._window, now)
+        latencies = sorted(latency for _, latency in self._latencies)
+        bytes_per_second = sum(count for _, count in self._bytes) / window
+
+        utilization = (
+            bytes_per_second * 10 / self._baud_rate if self._baud_rate > 0 else 0
+        )
+
+        return Statistics(
+            fps=len(self._frames) / window,
+            p50=_percentile(latencies, 50),
+            p95=_percentile(latencies, 95),
+            p99=_percentile(latencies, 99),
+            bytes_per_second=bytes_per_second,
+            utilization=utilization,
+            samples=len(latencies),
+        )
+
+    def export(self, path: str) -> None:
+        rows = [record.row() for record in self._records]
+
+        with open(path, "w", newline="") as file:
+            if path.endswith(".json"):
+                summary = self.statistics()._asdict()
+                summary["baud_rate"] = self._baud_rate
+                json.dump({"summary": summary, "commands": rows}, file, indent=2)
+            else:
+                writer = csv.DictWriter(file, fieldnames=_FIELDS)
+                writer.writeheader()
+                writer.writerows(rows)
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._start
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    if len(values) == 0:
+        return 0
+
+    return values[min(len(values) - 1, len(values) * percent // 100)]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from PySide6.QtCore import Qt, Slot
+from PySide6.QtWidgets import (
+    QDockWidget,
+    QFileDialog,
+    QFormLayout,
+    QHBoxLayout,
+    QLabel,
+    QMessageBox,
+    QPushButton,
+    QSpinBox,
+    QVBoxLayout,
+    QWidget,
+)
+
+from flipflops.display import Display
+from flipflops.scheduler import Timings
+from flipflops.telemetry import Statistics
+
+
+class TelemetryPanel(QDockWidget):
+    def __init__(self, display: Display) -> None:
+        super().__init__(
+            "Telemetry",
+            allowedAreas=Qt.DockWidgetArea.BottomDockWidgetArea
+            | Qt.DockWidgetArea.RightDockWidgetArea,
+            features=QDockWidget.DockWidgetFeature.NoDockWidgetFeatures
+            | QDockWidget.DockWidgetFeature.DockWidgetMovable,
+        )
+
+        self._display: Display = display
+        self._display.on_statistics.connect(self._handle_statistics)
+        self._display.on_export.connect(self._handle_export_done)
+        self._display.on_ready.connect(self._handle_ready)
+        self._display.on_close.connect(self._handle_close)
+        self._display.on_calibrated.connect(self._handle_calibrated)
+
+        root = QWidget()
+
+        vbox = QVBoxLayout()
+        vbox.setSpacing(5)
+        vbox.setContentsMargins(5, 5, 5, 5)
+
+        form = QFormLayout()
+        form.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+
+        self._fps: QLabel = QLabel()
+        form.addRow("Frames/s:", self._fps)
+
+        self._p50: QLabel = QLabel()
+        form.addRow("Latency p50:", self._p50)
+
+        self._p95: QLabel = QLabel()
+        form.addRow("Latency p95:", self._p95)
+
+        self._p99: QLabel = QLabel()
+        form.addRow("Latency p99:", self._p99)
+
+        self._throughput: QLabel = QLabel()
+        form.addRow("Throughput:", self._throughput)
+
+        self._utilization: QLabel = QLabel()
+        form.addRow("Utilization:", self._utilization)
+
+        self._superseded: QLabel = QLabel()
+        form.addRow("Superseded:", self._superseded)
+
+        self._skipped: QLabel = QLabel()
+        form.addRow("Skipped:", self._skipped)
+
+        self._row_flip: QLabel = QLabel("-")
+        form.addRow("Row flip:", self._row_flip)
+
+        self._dot_flip: QLabel = QLabel("-")
+        form.addRow("Dot flip:", self._dot_flip)
+
+        vbox.addLayout(form)
+        vbox.addStretch(1)
+
+        hbox = QHBoxLayout()
+        hbox.setSpacing(5)
+        hbox.setContentsMargins(0, 0, 0, 0)
+
+        self._max_coils: QSpinBox = QSpinBox(
+            minimum=0, maximum=9999, prefix="Max Coils: "
+        )
+        self._max_coils.setSpecialValueText("Max Coils: Unlimited")
+        self._max_coils.valueChanged.connect(self._handle_max_coils)
+        hbox.addWidget(self._max_coils)
+
+        hbox.addStretch(1)
+
+        self._calibrate: QPushButton = QPushButton("Calibrate")
+        self._calibrate.setEnabled(False)
+        self._calibrate.clicked.connect(self._handle_calibrate)
+        hbox.addWidget(self._calibrate)
+
+        export = QPushButton("Export...")
+        export.clicked.connect(self._handle_export)
+        hbox.addWidget(export)
+
+        vbox.addLayout(hbox)
+
+        root.setLayout(vbox)
+        self.setWidget(root)
+
+        self._handle_statistics(self._display.statistics())
+
+    @Slot(Statistics)
+    def _handle_statistics(self, statistics: Statistics) -> None:
+        self._fps.setText(f"{statistics.fps:.1f}")
+
+        if statistics.samples == 0:
+            self._p50.setText("-")
+            self._p95.setText("-")
+            self._p99.setText("-")
+        else:
+            self._p50.setText(f"{statistics.p50 * 1000:.1f} ms")
+            self._p95.setText(f"{statistics.p95 * 1000:.1f} ms")
+            self._p99.setText(f"{statistics.p99 * 1000:.1f} ms")
+
+        self._throughput.setText(f"{statistics.bytes_per_second:.0f} bytes/s")
+        self._utilization.setText(f"{statistics.utilization:.0%}")
+        self._superseded.setText(f"{self._display.superseded()} frames")
+        self._skipped.setText(f"{self._display.skipped()} frames")
+
+    @Slot()
+    def _handle_export(self) -> None:
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Telemetry",
+            "telemetry.csv",
+            "CSV (*.csv);;JSON (*.json)",
+        )
+
+        if len(path) == 0:
+            return
+
+        self._display.export_telemetry(path)
+
+    @Slot(str, str)
+    def _handle_export_done(self, path: str, error: str) -> None:
+        if len(error) > 0:
+            QMessageBox.critical(
+                self, "FlipFlops", f"Failed to export telemetry to {path}: {error}"
+            )
+
+    @Slot()
+    def _handle_ready(self) -> None:
+        self._calibrate.setEnabled(True)
+
+    @Slot()
+    def _handle_close(self) -> None:
+        self._calibrate.setEnabled(False)
+
+    @Slot(int)
+    def _handle_max_coils(self, value: int) -> None:
+        self._display.set_max_coils(None if value == 0 else value)
+
+    @Slot()
+    def _handle_calibrate(self) -> None:
+        self._calibrate.setEnabled(False)
+        self._display.calibrate()
+
+    @Slot(Timings)
+    def _handle_calibrated(self, timings: Timings) -> None:
+        row = sum(timings.rows) / len(timings.rows)
+
+        self._row_flip.setText(f"{row * 1000:.2f} ms")
+        self._dot_flip.setText(f"{timings.dot * 1000:.2f} ms")
+        self._calibrate.setEnabled(True)
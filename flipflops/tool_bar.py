@@ -7,6 +7,8 @@ from PySide6.QtSerialPort import QSerialPortInfo
 from PySide6.QtWidgets import QComboBox, QPushButton, QToolBar, QWidget
 
 from flipflops.display import Display
+from flipflops.frame import Geometry
+from flipflops.simulator import running_simulators
 
 
 class _PortSelect(QComboBox):
@@ -26,10 +28,41 @@ class _PortSelect(QComboBox):
         for port in QSerialPortInfo.availablePorts():
             self.addItem(port.systemLocation(), port)
 
+        for path in running_simulators():
+            self.addItem(path, path)
+
+
+class _BaudSelect(QComboBox):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.addItem("Auto", None)
+
+        for baud_rate in [9600, 19200, 57600, 115200, 230400, 1000000]:
+            self.addItem(f"{baud_rate} baud", baud_rate)
+
+
+class _GeometrySelect(QComboBox):
+    def __init__(self) -> None:
+        super().__init__()
+
+        for geometry in [Geometry(6, 6), Geometry(28, 14), Geometry(56, 28)]:
+            self.addItem(str(geometry), geometry)
+
+    def set_geometry(self, geometry: Geometry) -> None:
+        for index in range(self.count()):
+            if self.itemData(index) == geometry:
+                self.setCurrentIndex(index)
+                return
+
+        self.addItem(str(geometry), geometry)
+        self.setCurrentIndex(self.count() - 1)
+
 
 class ToolBar(QToolBar):
     on_console_toggle: Signal = Signal(bool)
     on_instructions_toggle: Signal = Signal(bool)
+    on_telemetry_toggle: Signal = Signal(bool)
 
     def __init__(self, display: Display) -> None:
         super().__init__(movable=False)
@@ -46,11 +79,20 @@ class ToolBar(QToolBar):
         self._display: Display = display
         self._display.on_open.connect(self._handle_display_open)
         self._display.on_close.connect(self._handle_display_close)
+        self._display.on_geometry_change.connect(self._handle_geometry_change)
 
         self._port_select: _PortSelect = _PortSelect()
         self._port_select.setFixedWidth(300)
         self.addWidget(self._port_select)
 
+        self._baud_select: _BaudSelect = _BaudSelect()
+        self.addWidget(self._baud_select)
+
+        self._geometry_select: _GeometrySelect = _GeometrySelect()
+        self._geometry_select.set_geometry(self._display.geometry())
+        self._geometry_select.currentIndexChanged.connect(self._handle_geometry_select)
+        self.addWidget(self._geometry_select)
+
         self._display_connected: bool = False
         self._display_toggle: QPushButton = QPushButton("Disconnect")
         self._display_toggle.setFixedWidth(self._display_toggle.sizeHint().width())
@@ -70,6 +112,17 @@ class ToolBar(QToolBar):
         self._console_toggle.clicked.connect(self._handle_console_toggle)
         self.addWidget(self._console_toggle)
 
+        if style_name == "macos":
+            spacer = QWidget()
+            spacer.setFixedWidth(5)
+            self.addWidget(spacer)
+
+        self._telemetry_toggle: QPushButton = QPushButton("Telemetry")
+        self._telemetry_toggle.setCheckable(True)
+        self._telemetry_toggle.setChecked(False)
+        self._telemetry_toggle.clicked.connect(self._handle_telemetry_toggle)
+        self.addWidget(self._telemetry_toggle)
+
         if style_name == "macos":
             spacer = QWidget()
             spacer.setFixedWidth(5)
@@ -85,6 +138,8 @@ class ToolBar(QToolBar):
     def _handle_display_open(self) -> None:
         self._display_toggle.setEnabled(True)
         self._port_select.setEnabled(False)
+        self._baud_select.setEnabled(False)
+        self._geometry_select.setEnabled(False)
         self._display_toggle.setText("Disconnect")
         self._display_connected = True
 
@@ -92,6 +147,8 @@ class ToolBar(QToolBar):
     def _handle_display_close(self) -> None:
         self._display_toggle.setEnabled(True)
         self._port_select.setEnabled(True)
+        self._baud_select.setEnabled(True)
+        self._geometry_select.setEnabled(True)
         self._display_toggle.setText("Connect")
         self._display_connected = False
 
@@ -99,16 +156,32 @@ class ToolBar(QToolBar):
     def _handle_display_toggle(self) -> None:
         self._display_toggle.setEnabled(False)
         self._port_select.setEnabled(False)
+        self._baud_select.setEnabled(False)
+        self._geometry_select.setEnabled(False)
 
         if self._display_connected:
             self._display.close()
         else:
-            self._display.open(self._port_select.currentData())
+            self._display.open(
+                self._port_select.currentData(), self._baud_select.currentData()
+            )
+
+    @Slot(Geometry)
+    def _handle_geometry_change(self, geometry: Geometry) -> None:
+        self._geometry_select.set_geometry(geometry)
+
+    @Slot(int)
+    def _handle_geometry_select(self, index: int) -> None:
+        self._display.set_geometry(self._geometry_select.itemData(index))
 
     @Slot()
     def _handle_console_toggle(self) -> None:
         self.on_console_toggle.emit(self._console_toggle.isChecked())
 
+    @Slot()
+    def _handle_telemetry_toggle(self) -> None:
+        self.on_telemetry_toggle.emit(self._telemetry_toggle.isChecked())
+
     @Slot()
     def _handle_instructions_toggle(self) -> None:
         self.on_instructions_toggle.emit(self._instructions_toggle.isChecked())
@@ -1,24 +1,29 @@
-# TODO: Add audio support.
-# TODO: Support displays of sizes other than 6x6.
-
 from __future__ import annotations
 
 from PySide6.QtCore import Qt, Slot
-from PySide6.QtGui import QImage, qGray
-from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
+from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer, QVideoFrame
 from PySide6.QtMultimediaWidgets import QVideoWidget
 from PySide6.QtWidgets import (
+    QComboBox,
     QFileDialog,
     QHBoxLayout,
     QLabel,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QSlider,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
 
+from flipflops.animation import AnimationReader
+from flipflops.av_sync import AvSync
+from flipflops.conversion import Converter
 from flipflops.display import Display
+from flipflops.frame import Geometry
+from flipflops.luma import convert_video_frame
+from flipflops.pre_render import PreRenderer
 
 
 class VideoPlayer(QWidget):
@@ -27,11 +32,21 @@ class VideoPlayer(QWidget):
 
         self._index: int = index
 
-        self._ready: bool = False
         self._display: Display = display
         self._display.on_ready.connect(self._handle_ready)
-        self._display.on_done.connect(self._handle_ready)
         self._display.on_close.connect(self._handle_close)
+        self._display.on_done.connect(self._handle_done)
+        self._display.on_geometry_change.connect(self._handle_geometry_change)
+
+        self._renderer: PreRenderer = PreRenderer()
+        self._renderer.on_progress.connect(self._handle_render_progress)
+        self._renderer.on_finish.connect(self._handle_render_finish)
+        self._renderer.on_error.connect(self._handle_render_error)
+
+        self._source: str = ""
+        self._converter: Converter = Converter()
+        self._reader: AnimationReader | None = None
+        self._sync: AvSync = AvSync()
 
         self._audio: QAudioOutput = QAudioOutput()
         self._media: QMediaPlayer | None = None
@@ -90,6 +105,45 @@ class VideoPlayer(QWidget):
         self._seek_label: QLabel = QLabel("--:-- / --:--")
         hbox.addWidget(self._seek_label)
 
+        self._mode_select: QComboBox = QComboBox()
+
+        for mode in Converter.Mode:
+            self._mode_select.addItem(str(mode), mode)
+
+        self._mode_select.currentIndexChanged.connect(self._handle_conversion_change)
+        hbox.addWidget(self._mode_select)
+
+        self._threshold: QSpinBox = QSpinBox()
+        self._threshold.setRange(0, 255)
+        self._threshold.setValue(128)
+        self._threshold.setPrefix("Threshold: ")
+        self._threshold.valueChanged.connect(self._handle_conversion_change)
+        hbox.addWidget(self._threshold)
+
+        self._hysteresis: QSpinBox = QSpinBox()
+        self._hysteresis.setRange(0, 64)
+        self._hysteresis.setValue(0)
+        self._hysteresis.setPrefix("Hysteresis: ")
+        self._hysteresis.valueChanged.connect(self._handle_conversion_change)
+        hbox.addWidget(self._hysteresis)
+
+        self._audio_latency: QSpinBox = QSpinBox()
+        self._audio_latency.setRange(0, 1000)
+        self._audio_latency.setPrefix("Audio Output Latency: ")
+        self._audio_latency.setSuffix(" ms")
+        self._audio_latency.valueChanged.connect(self._handle_audio_latency_change)
+        hbox.addWidget(self._audio_latency)
+
+        self._sync_label: QLabel = QLabel()
+        self._update_sync_label()
+        hbox.addWidget(self._sync_label)
+
+        self._render_progress: QProgressBar = QProgressBar()
+        self._render_progress.setFixedWidth(100)
+        self._render_progress.setFormat("Rendering %p%")
+        self._render_progress.setVisible(False)
+        hbox.addWidget(self._render_progress)
+
         vbox.addLayout(hbox)
 
         self.setLayout(vbox)
@@ -102,31 +156,42 @@ class VideoPlayer(QWidget):
             self._play_pause.setText("Play")
             self._media.pause()
 
-    def _write_display(self) -> None:
+    @Slot(QVideoFrame)
+    def _handle_frame_change(self, frame: QVideoFrame) -> None:
         assert self._media is not None
 
-        frame = self._media.videoSink().videoFrame()
-
-        if not frame.isValid():
+        if (
+            not self._media.isPlaying()
+            or not frame.isValid()
+            or not self._display.can_write()
+        ):
             return
 
-        image = frame.toImage()
-        image.convertTo(QImage.Format.Format_Mono)
+        geometry = self._display.geometry()
+        position = self._media.position() * 1000 - self._audio_latency.value() * 1000
 
-        w = image.width()
-        h = image.height()
-        s = min(w, h)
-        x = (w - s) // 2
-        y = (h - s) // 2
+        if self._reader is not None and self._reader.geometry() == geometry:
+            time = max(0, position + self._sync.latency())
+            index = min(time * self._reader.fps() // 1_000_000, len(self._reader) - 1)
+            if self._display.submit(self._reader.frame(index)):
+                self._sync.sent(index * 1_000_000 // self._reader.fps())
+        else:
+            time = frame.startTime()
 
-        image = image.copy(x, y, s, s).scaled(6, 6)
+            if self._display.submit(
+                convert_video_frame(frame, geometry, self._converter)
+            ):
+                self._sync.sent(time if time >= 0 else position)
 
-        # TODO: Clean this up, precalculate all frames for performance
-        points = (divmod(i, 6) for i in range(36))
-        grays = (qGray(image.pixel(x, y)) for y, x in points)
-        dots = [Display.Dot.BLACK if gray == 0 else Display.Dot.WHITE for gray in grays]
+    @Slot()
+    def _handle_done(self) -> None:
+        if self._media is None or not self._media.isPlaying():
+            return
 
-        self._display.write_display(dots)
+        self._sync.done(
+            self._media.position() * 1000 - self._audio_latency.value() * 1000
+        )
+        self._update_sync_label()
 
     @Slot()
     def _handle_close(self) -> None:
@@ -140,11 +205,6 @@ class VideoPlayer(QWidget):
     def _handle_ready(self) -> None:
         self._play_pause.setEnabled(True)
 
-        if self._media is not None and self._media.isPlaying():
-            self._write_display()
-        else:
-            self._ready = True
-
     @Slot()
     def _handle_open(self) -> None:
         # TODO: Properly configure file dialog.
@@ -163,9 +223,12 @@ class VideoPlayer(QWidget):
             self._media.durationChanged.connect(self._handle_duration_change)
             self._media.positionChanged.connect(self._handle_position_change)
             self._media.errorOccurred.connect(self._handle_error)
+            self._media.videoSink().videoFrameChanged.connect(self._handle_frame_change)
 
         self._media.pause()
         self._media.setSource(url)
+        self._source = url.toLocalFile()
+        self._render()
         self._play_pause.setText("Play")
         self._seek_slider.setEnabled(True)
         self._seek_slider.setValue(0)
@@ -178,6 +241,8 @@ class VideoPlayer(QWidget):
 
         self._media.pause()
         self._media.setSource("")
+        self._source = ""
+        self._render()
         self._play_pause.setEnabled(False)
         self._play_pause.setText("Play")
         self._seek_slider.setEnabled(False)
@@ -203,6 +268,7 @@ class VideoPlayer(QWidget):
     @Slot(bool)
     def _handle_playing_change(self, playing: bool) -> None:
         self._play_pause.setText("Pause" if playing else "Play")
+        self._sync.reset()
 
     @Slot(int)
     def _handle_duration_change(self, duration: int) -> None:
@@ -232,10 +298,6 @@ class VideoPlayer(QWidget):
         assert self._media is not None
         assert self._total_time is not None
 
-        if self._ready and self._media.isPlaying():
-            self._ready = False
-            self._write_display()
-
         rest = round(position / 1000)
         rest, seconds = divmod(rest, 60)
         hours, minutes = divmod(rest, 60)
@@ -269,3 +331,60 @@ class VideoPlayer(QWidget):
 
         if self._was_playing:
             self._media.play()
+
+    @Slot(Geometry)
+    def _handle_geometry_change(self, geometry: Geometry) -> None:
+        self._render()
+
+    @Slot()
+    def _handle_conversion_change(self) -> None:
+        self._converter = Converter(
+            self._mode_select.currentData(),
+            self._threshold.value(),
+            self._hysteresis.value(),
+        )
+        self._render()
+
+    @Slot(int)
+    def _handle_render_progress(self, percent: int) -> None:
+        self._render_progress.setValue(percent)
+
+    @Slot(str)
+    def _handle_render_finish(self, path: str) -> None:
+        self._render_progress.setVisible(False)
+
+        try:
+            self._reader = AnimationReader(path)
+        except (OSError, ValueError) as error:
+            QMessageBox.critical(self, "Video Player", f"{error}")
+
+    @Slot(str)
+    def _handle_render_error(self, message: str) -> None:
+        self._render_progress.setVisible(False)
+        QMessageBox.critical(self, "Video Player", f"Failed to render: {message}")
+
+    def _render(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+        if len(self._source) == 0:
+            self._renderer.cancel()
+            self._render_progress.setVisible(False)
+            return
+
+        self._render_progress.setValue(0)
+        self._render_progress.setVisible(True)
+        self._renderer.render(self._source, self._display.geometry(), self._converter)
+
+    @Slot(int)
+    def _handle_audio_latency_change(self, latency: int) -> None:
+        self._sync.reset()
+
+    def _update_sync_label(self) -> None:
+        text = str(self._sync.statistics())
+
+        if self._reader is None or self._reader.geometry() != self._display.geometry():
+            text += " (live, not compensated)"
+
+        self._sync_label.setText(text)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, QUrl, Signal, Slot
+from PySide6.QtMultimedia import QMediaPlayer, QVideoFrame, QVideoSink
+
+from flipflops.conversion import Converter
+from flipflops.display import Display
+from flipflops.luma import convert_video_frame
+
+
+class VideoStream(QObject):
+    on_finish: Signal = Signal()
+    on_error: Signal = Signal(str)
+
+    def __init__(
+        self, path: str, display: Display, converter: Converter, loop: bool = False
+    ) -> None:
+        super().__init__()
+
+        self._display: Display = display
+        self._converter: Converter = converter
+
+        self._sink: QVideoSink = QVideoSink(self)
+        self._sink.videoFrameChanged.connect(self._handle_frame)
+
+        self._media: QMediaPlayer = QMediaPlayer(self)
+        self._media.setVideoSink(self._sink)
+        self._media.mediaStatusChanged.connect(self._handle_status)
+        self._media.errorOccurred.connect(self._handle_error)
+
+        if loop:
+            self._media.setLoops(QMediaPlayer.Loops.Infinite)
+
+        self._media.setSource(QUrl.fromLocalFile(path))
+
+    def play(self) -> None:
+        self._media.play()
+
+    def stop(self) -> None:
+        self._media.stop()
+
+    @Slot(QVideoFrame)
+    def _handle_frame(self, frame: QVideoFrame) -> None:
+        if not frame.isValid() or not self._display.can_write():
+            return
+
+        geometry = self._display.geometry()
+        self._display.submit(convert_video_frame(frame, geometry, self._converter))
+
+    @Slot(QMediaPlayer.MediaStatus)
+    def _handle_status(self, status: QMediaPlayer.MediaStatus) -> None:
+        if status == QMediaPlayer.MediaStatus.EndOfMedia:
+            self.on_finish.emit()
+
+    @Slot(QMediaPlayer.Error, str)
+    def _handle_error(self, error: QMediaPlayer.Error, message: str) -> None:
+        self.on_error.emit(f"{error.name}: {message}.")
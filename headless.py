@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import argparse
+import signal
+import sys
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import QCoreApplication, QObject, Qt, QTimer, Slot
+from PySide6.QtSerialPort import QSerialPort
+
+from flipflops.animation import AnimationReader
+from flipflops.conversion import Converter
+from flipflops.display import Display
+from flipflops.frame import Geometry
+from flipflops.generators import Generator, Lookahead, RandomDots
+from flipflops.playback_clock import PlaybackClock
+
+if TYPE_CHECKING:
+    from flipflops.video_stream import VideoStream
+
+
+class Headless(QObject):
+    def __init__(self, args: argparse.Namespace) -> None:
+        super().__init__()
+
+        self._args: argparse.Namespace = args
+
+        self._display: Display = Display()
+        self._display.on_ready.connect(self._handle_ready)
+        self._display.on_writable.connect(self._handle_tick)
+        self._display.on_close.connect(self._handle_close)
+        self._display.on_error.connect(self._handle_error)
+
+        self._reader: AnimationReader | None = None
+        self._clock: PlaybackClock | None = None
+        self._video: VideoStream | None = None
+        self._converter: Converter = Converter(
+            Converter.Mode[args.mode.upper()], args.threshold, args.hysteresis
+        )
+        self._lookahead: Lookahead | None = None
+        self._playing: bool = False
+
+        self._timer: QTimer = QTimer(
+            interval=1000 // 60, timerType=Qt.TimerType.PreciseTimer
+        )
+        self._timer.timeout.connect(self._handle_tick)
+
+        if args.animation is not None:
+            self._reader = AnimationReader(args.animation)
+            self._clock = PlaybackClock(
+                self._reader.fps(), PlaybackClock.Policy[args.policy.upper()]
+            )
+
+        self._display.open(args.port, args.baud)
+
+    @Slot()
+    def _handle_ready(self) -> None:
+        if self._playing:
+            return
+
+        self._playing = True
+
+        if self._args.width is not None and self._args.height is not None:
+            self._display.set_geometry(Geometry(self._args.width, self._args.height))
+
+        if self._args.video is not None:
+            self._play_video()
+        elif self._clock is not None:
+            self._clock.start()
+            self._timer.start()
+        else:
+            self._start_generator()
+
+    @Slot()
+    def _handle_tick(self) -> None:
+        if not self._playing or not self._display.can_write():
+            return
+
+        if self._reader is not None:
+            assert self._clock is not None
+
+            index = self._clock.next()
+
+            if index is None:
+                return
+
+            if index >= len(self._reader):
+                if not self._args.loop:
+                    self._finish()
+                    return
+
+                self._clock.start()
+                return
+
+            frame = self._reader.frame(index)
+            self._display.submit(frame.fit(self._display.geometry()))
+        elif self._lookahead is not None:
+            if self._lookahead.generator().geometry() != self._display.geometry():
+                self._start_generator()
+                return
+
+            while self._display.can_write():
+                self._display.write_frame(self._lookahead.take())
+
+    @Slot()
+    def _handle_close(self) -> None:
+        QCoreApplication.quit()
+
+    @Slot(QSerialPort.SerialPortError)
+    def _handle_error(self, error: QSerialPort.SerialPortError) -> None:
+        print(
+            f"{error.name}: Display serial disconnected unexpectedly.", file=sys.stderr
+        )
+        QCoreApplication.exit(1)
+
+    def _start_generator(self) -> None:
+        generator = Generator.create(
+            Generator.Kind[self._args.generator.upper()], self._display.geometry()
+        )
+
+        if isinstance(generator, RandomDots):
+            generator.set_changes(self._args.changes)
+
+        self._lookahead = Lookahead(generator)
+        self._handle_tick()
+
+    def _play_video(self) -> None:
+        from flipflops.video_stream import VideoStream
+
+        self._video = VideoStream(
+            self._args.video, self._display, self._converter, self._args.loop
+        )
+        self._video.on_finish.connect(self._finish)
+        self._video.on_error.connect(self._handle_video_error)
+        self._video.play()
+
+    @Slot(str)
+    def _handle_video_error(self, message: str) -> None:
+        print(message, file=sys.stderr)
+        QCoreApplication.exit(1)
+
+    @Slot()
+    def _finish(self) -> None:
+        self._playing = False
+        self._timer.stop()
+
+        if self._video is not None:
+            self._video.stop()
+
+        self._display.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Stream to a flip disc display without opening a window."
+    )
+    parser.add_argument("port", help="serial port name or path")
+    parser.add_argument(
+        "--baud", type=int, help="fixed baud rate, negotiated when left out"
+    )
+    parser.add_argument("--width", type=int, help="override the reported width")
+    parser.add_argument("--height", type=int, help="override the reported height")
+    parser.add_argument("--loop", action="store_true", help="restart at the end")
+
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--video", help="video file to convert while playing")
+    source.add_argument("--animation", help="animation file to play")
+    source.add_argument(
+        "--generator",
+        choices=[kind.name.lower() for kind in Generator.Kind],
+        help="generate frames as fast as possible",
+    )
+
+    parser.add_argument(
+        "--mode",
+        choices=[mode.name.lower() for mode in Converter.Mode],
+        default="fixed",
+        help="video conversion mode",
+    )
+    parser.add_argument("--threshold", type=int, default=128)
+    parser.add_argument("--hysteresis", type=int, default=0)
+    parser.add_argument(
+        "--policy",
+        choices=[policy.name.lower() for policy in PlaybackClock.Policy],
+        default="drop",
+        help="what to do when animation frames fall behind",
+    )
+    parser.add_argument(
+        "--changes", type=int, default=1, help="dots flipped per random frame"
+    )
+
+    args = parser.parse_args()
+
+    if (args.width is None) != (args.height is None):
+        parser.error("--width and --height must be given together")
+
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    app = QCoreApplication(sys.argv)
+    app.setOrganizationName("HereIsKevin")
+    app.setOrganizationDomain("hereiskevin.com")
+    app.setApplicationName("FlipFlops")
+
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+    try:
+        headless = Headless(args)
+    except (OSError, ValueError) as error:
+        sys.exit(f"{error}")
+
+    sys.exit(app.exec())
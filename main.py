@@ -12,6 +12,7 @@ from PySide6.QtSerialPort import QSerialPort
 from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox, QTabWidget
 
 import rc_flipflops
+from flipflops.animation_player import AnimationPlayer
 from flipflops.bad_apple import BadApple
 from flipflops.console import Console
 from flipflops.display import Display
@@ -19,6 +20,7 @@ from flipflops.instructions import Instructions
 from flipflops.paint import Paint
 from flipflops.randomize import Randomize
 from flipflops.snake_game import SnakeGame
+from flipflops.telemetry_panel import TelemetryPanel
 from flipflops.tool_bar import ToolBar
 from flipflops.video_player import VideoPlayer
 
@@ -41,12 +43,17 @@ class FlipFlops(QMainWindow):
         console = Console(display)
         self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, console)
 
+        telemetry_panel = TelemetryPanel(display)
+        telemetry_panel.hide()
+        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, telemetry_panel)
+
         instructions = Instructions()
         instructions.hide()
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, instructions)
 
         tool_bar = ToolBar(display)
         tool_bar.on_console_toggle.connect(console.setVisible)
+        tool_bar.on_telemetry_toggle.connect(telemetry_panel.setVisible)
         tool_bar.on_instructions_toggle.connect(instructions.setVisible)
         self.addToolBar(tool_bar)
 
@@ -62,7 +69,12 @@ class FlipFlops(QMainWindow):
         self._tabs.currentChanged.connect(self._bad_apple.handle_switch)
         self._tabs.addTab(self._bad_apple, "Bad Apple!!")
 
-        self._randomize: Randomize = Randomize(2, display)
+        self._animation_player: AnimationPlayer = AnimationPlayer(2, display)
+        self._animation_player.setEnabled(False)
+        self._tabs.currentChanged.connect(self._animation_player.handle_switch)
+        self._tabs.addTab(self._animation_player, "Animation Player")
+
+        self._randomize: Randomize = Randomize(3, display)
         self._randomize.setEnabled(False)
         self._tabs.currentChanged.connect(self._randomize.handle_switch)
         self._tabs.addTab(self._randomize, "Randomize")
@@ -71,7 +83,7 @@ class FlipFlops(QMainWindow):
         self._paint.setEnabled(False)
         self._tabs.addTab(self._paint, "Paint")
 
-        self._snake_game: SnakeGame = SnakeGame(4, display)
+        self._snake_game: SnakeGame = SnakeGame(5, display)
         self._snake_game.setEnabled(False)
         self._tabs.currentChanged.connect(self._snake_game.handle_switch)
         self._tabs.addTab(self._snake_game, "Snake Game")
@@ -83,15 +95,16 @@ class FlipFlops(QMainWindow):
 
     @Slot()
     def _handle_toggle(self) -> None:
-        if self._tabs.currentIndex() == 3:
-            self._tabs.setCurrentIndex(4)
+        if self._tabs.currentIndex() == 4:
+            self._tabs.setCurrentIndex(5)
         else:
-            self._tabs.setCurrentIndex(3)
+            self._tabs.setCurrentIndex(4)
 
     @Slot()
     def _handle_open(self) -> None:
         self._video_player.setEnabled(True)
         self._bad_apple.setEnabled(True)
+        self._animation_player.setEnabled(True)
         self._randomize.setEnabled(True)
         self._paint.setEnabled(True)
         self._snake_game.setEnabled(True)
@@ -100,6 +113,7 @@ class FlipFlops(QMainWindow):
     def _handle_close(self) -> None:
         self._video_player.setEnabled(False)
         self._bad_apple.setEnabled(False)
+        self._animation_player.setEnabled(False)
         self._randomize.setEnabled(False)
         self._paint.setEnabled(False)
         self._snake_game.setEnabled(False)
@@ -116,6 +130,9 @@ class FlipFlops(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setOrganizationName("HereIsKevin")
+    app.setOrganizationDomain("hereiskevin.com")
+    app.setApplicationName("FlipFlops")
 
     flip_flops = FlipFlops()
     flip_flops.show()
@@ -0,0 +1,43 @@
+#!/usr/bin/env -S uv run
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from flipflops.animation import Animation, AnimationWriter  # noqa: E402
+from flipflops.frame import Frame, Geometry  # noqa: E402
+
+parser = argparse.ArgumentParser(
+    description="Convert a JSON list of ASCII frames into a binary animation."
+)
+parser.add_argument("input", type=Path)
+parser.add_argument("output", type=Path)
+parser.add_argument("--width", type=int, default=6)
+parser.add_argument("--height", type=int, default=6)
+parser.add_argument("--fps", type=int, default=30)
+parser.add_argument(
+    "--stream", action="store_true", help="write keyframes and RLE deltas"
+)
+parser.add_argument("--keyframe-interval", type=int, default=300)
+args = parser.parse_args()
+
+geometry = Geometry(args.width, args.height)
+
+with args.input.open() as file:
+    frames = [Frame.from_ascii(geometry, frame) for frame in json.load(file)]
+
+if args.stream:
+    writer = AnimationWriter(
+        str(args.output), geometry, args.fps, args.keyframe_interval
+    )
+
+    for frame in frames:
+        writer.write(frame)
+
+    writer.close()
+else:
+    args.output.write_bytes(Animation.encode(geometry, args.fps, frames))
@@ -0,0 +1,53 @@
+#!/usr/bin/env -S uv run
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from flipflops.animation import (  # noqa: E402
+    Animation,
+    AnimationReader,
+    AnimationWriter,
+)
+from flipflops.optimizer import Optimizer  # noqa: E402
+
+parser = argparse.ArgumentParser(
+    description="Rewrite an animation to flip fewer dots within an error budget."
+)
+parser.add_argument("input", type=Path)
+parser.add_argument("output", type=Path)
+parser.add_argument(
+    "--budget", type=int, default=2, help="most wrong dots in any frame"
+)
+parser.add_argument(
+    "--hold", type=int, default=2, help="frames a dot must stay wrong to flip"
+)
+parser.add_argument(
+    "--stream", action="store_true", help="write keyframes and RLE deltas"
+)
+parser.add_argument("--keyframe-interval", type=int, default=300)
+args = parser.parse_args()
+
+reader = AnimationReader(str(args.input))
+optimizer = Optimizer(args.budget, args.hold)
+frames = optimizer.optimize(reader.frame(index) for index in range(len(reader)))
+
+if args.stream:
+    writer = AnimationWriter(
+        str(args.output), reader.geometry(), reader.fps(), args.keyframe_interval
+    )
+
+    for frame in frames:
+        writer.write(frame)
+
+    writer.close()
+else:
+    args.output.write_bytes(
+        Animation.encode(reader.geometry(), reader.fps(), list(frames))
+    )
+
+reader.close()
+print(optimizer.report())